@@ -0,0 +1,12 @@
+"""
+Algorithms mapping a list of integers to the indices of a range of numbers (lst_to_dict_alg), and finding two numbers of
+a list which add up to a target (target_sum), with the binary input files, instrumentation and command line driver they
+share. numpy, used by some engines, is only imported when one of them runs (see backends), and so is multiprocessing,
+used by the parallel engines (see parallel). Both algorithms dispatch on the input statistics and 64 bit bounds of
+inputs. The benchmark suite (benchmark), differential fuzzing (fuzz), asyncio front end (service) and result cache
+(cache) are modules of the package too.
+
+Install with pip install -e . (pip install -e .[numpy] for the numpy engines), which adds the efficiency command, the
+same as python -m efficiency. The benchmarks and fuzzing run with python -m efficiency.benchmark and python -m
+efficiency.fuzz.
+"""
@@ -0,0 +1,36 @@
+"""
+Optional backends, imported on first use instead of at import time, so that importing the package and small calls which
+never reach a numpy code path don't pay for importing numpy.
+"""
+from types import ModuleType
+import functools
+import importlib.util
+import sys
+
+@functools.lru_cache(maxsize=None)
+def has_numpy() -> bool:
+    """
+    :return: True if numpy is installed, found without importing it
+    """
+    return "numpy" in sys.modules or importlib.util.find_spec("numpy") is not None
+
+@functools.lru_cache(maxsize=None)
+def numpy() -> ModuleType:
+    """
+    :return: the numpy module, imported on the first call, or None if it is not installed
+    """
+    try:
+        import numpy as module
+    except ImportError:
+        return None
+    return module
+
+def is_ndarray(obj: object) -> bool:
+    """
+    Check for a numpy array without importing numpy: if numpy was not imported yet, obj can't be an array.
+
+    :param obj: any object
+    :return: True if obj is a numpy array
+    """
+    module = sys.modules.get("numpy")
+    return module is not None and isinstance(obj, module.ndarray)
@@ -0,0 +1,311 @@
+"""
+Benchmark suite for the lst_to_dict and target_sum functions.
+
+Inputs are generated once per (size, density) from a fixed seed and frozen as tuples. Every timed call gets a fresh list
+copied outside of the timed region, so a function which modifies its input can't affect the measurements of the others.
+Each function is called 'warmup' times without measuring, then timed 'repeats' times with time.perf_counter_ns, and the
+samples are summarized as median, p95, mean, min and standard deviation in milliseconds. With --memory, one more call per
+function is traced with tracemalloc to record its peak allocation and the size of its result next to the timings. Results
+can be exported to JSON or CSV, and compared against an earlier JSON export to catch regressions.
+
+With --load, the asyncio front end in service.py is measured instead: a local load generator keeps --concurrency
+requests in flight against a few shared lists, and the latency of every request is summarized as p50, p95 and p99,
+together with the throughput, the number of executor batches and the longest stall of the event loop.
+
+Usage:
+    python -m efficiency.benchmark --sizes 10000 100000 --densities 0.1 0.5 --repeats 9 --json results.json
+    python -m efficiency.benchmark --baseline results.json
+    python -m efficiency.benchmark --sizes 1000000 --memory
+    python -m efficiency.benchmark --load --sizes 1000000 --concurrency 1 16 64 --requests 500
+"""
+from typing import List, Dict, Callable, Tuple, Union
+import asyncio
+import argparse
+import csv
+import json
+import math
+import random
+import statistics
+import sys
+import time
+
+from efficiency import backends, instrument, lst_to_dict_alg, target_sum
+from efficiency.service import AlgorithmService, LST_TO_DICT, TARGET_SUM
+
+Row = Dict[str, Union[str, int, float]]
+
+def lst_to_dict_functions() -> List[Callable]:
+    """
+    :return: lst_to_dict functions which are benchmarked by default. lst_to_dict_slow is left out, as it is quadratic.
+    """
+    functions = [lst_to_dict_alg.lst_to_dict_fast, lst_to_dict_alg.lst_to_dict_simple, lst_to_dict_alg.lst_to_dict_range,
+                 lst_to_dict_alg.lst_to_dict_bitset]
+    if backends.has_numpy():
+        functions.append(lst_to_dict_alg.lst_to_dict_numpy)
+    return functions
+
+def target_sum_functions() -> List[Callable]:
+    """
+    :return: target_sum functions which are benchmarked by default. target_sum_slow is left out, as it is quadratic.
+    """
+    functions = [target_sum.target_sum_fast, target_sum.target_sum_hash, target_sum.target_sum_bitset]
+    if backends.has_numpy():
+        functions.append(target_sum.target_sum_numpy)
+    return functions
+
+def frozen_input(size: int, density: float, seed: int = 0) -> Tuple[int, ...]:
+    """
+    Generate a shuffled tuple of distinct random integers, the same for the same arguments.
+
+    :param size: number of integers
+    :param density: fraction of the range [0, size / density) which is taken by the integers, at most 1
+    :param seed: seed of the random generator
+    :return: tuple of distinct integers in random order
+    """
+    if not 0 < density <= 1:
+        raise ValueError(f"density must be in (0, 1], got {density}")
+    rng = random.Random(f"{seed}-{size}-{density}")
+    return tuple(rng.sample(range(math.ceil(size / density)), size))
+
+def time_calls(func: Callable, args: Tuple, frozen_lst: Tuple[int, ...], warmup: int, repeats: int) -> List[int]:
+    """
+    Call func(list(frozen_lst), *args) 'warmup' times, then 'repeats' times measuring each call.
+
+    :param func: function to be measured
+    :param args: arguments after the list
+    :param frozen_lst: input list, copied for every call outside of the timed region
+    :param warmup: number of calls which are not measured
+    :param repeats: number of measured calls
+    :return: time of each measured call in nanoseconds
+    """
+    for _ in range(warmup):
+        _ = func(list(frozen_lst), *args)
+    samples = []
+    for _ in range(repeats):
+        lst = list(frozen_lst)
+        start_time = time.perf_counter_ns()
+        _ = func(lst, *args)
+        samples.append(time.perf_counter_ns() - start_time)
+    return samples
+
+def nearest_rank(ordered: List[int], fraction: float) -> int:
+    """
+    :param ordered: samples in ascending order
+    :param fraction: percentile as a fraction, e.g. 0.95
+    :return: nearest rank percentile of the samples
+    """
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+def summarize(samples: List[int]) -> Dict[str, float]:
+    """
+    :param samples: times in nanoseconds
+    :return: dict with median, p95 (nearest rank), mean, min and standard deviation in milliseconds
+    """
+    ordered = sorted(samples)
+    p95 = nearest_rank(ordered, 0.95)
+    return {
+        "median_ms": statistics.median(ordered) / 1_000_000,
+        "p95_ms": p95 / 1_000_000,
+        "mean_ms": statistics.fmean(ordered) / 1_000_000,
+        "min_ms": ordered[0] / 1_000_000,
+        "stddev_ms": (statistics.stdev(ordered) if len(ordered) > 1 else 0.0) / 1_000_000,
+    }
+
+def run_suite(sizes: List[int], densities: List[float], warmup: int = 1, repeats: int = 7, seed: int = 0,
+              lst_to_dict_funcs: List[Callable] = None, target_sum_funcs: List[Callable] = None, memory: bool = False) -> List[Row]:
+    """
+    Benchmark every function for every combination of input size and density. lst_to_dict functions are queried for
+    the range [5, size // 2] like in lst_to_dict_alg.single_speed_trial, target_sum functions with a target drawn
+    from the seeded generator, so the same arguments always measure the same work.
+
+    :param sizes: input list lengths
+    :param densities: fractions of the value range taken by the input integers
+    :param warmup: number of calls before measuring
+    :param repeats: number of measured calls
+    :param seed: seed of the input generator
+    :param lst_to_dict_funcs: lst_to_dict functions, defaults to lst_to_dict_functions()
+    :param target_sum_funcs: target_sum functions, defaults to target_sum_functions()
+    :param memory: also record peak allocation ('peak_bytes') and result size ('result_bytes') of one extra, untimed call
+    :return: one row per function, size and density with the summary of its measurements
+    """
+    if lst_to_dict_funcs is None:
+        lst_to_dict_funcs = lst_to_dict_functions()
+    if target_sum_funcs is None:
+        target_sum_funcs = target_sum_functions()
+    rows = []
+    for size in sizes:
+        for density in densities:
+            frozen_lst = frozen_input(size, density, seed)
+            target = random.Random(f"{seed}-{size}-{density}-target").randrange(2 * math.ceil(size / density))
+            cases = [(func, (5, size // 2)) for func in lst_to_dict_funcs]
+            cases += [(func, (target,)) for func in target_sum_funcs]
+            for func, args in cases:
+                row = {"module": func.__module__, "function": func.__name__, "size": size, "density": density,
+                       "warmup": warmup, "repeats": repeats}
+                row.update(summarize(time_calls(func, args, frozen_lst, warmup, repeats)))
+                line = (f"{row['function']:<24} size={size:<10} density={density:<6} median={row['median_ms']:10.3f}ms "
+                        f"p95={row['p95_ms']:10.3f}ms stddev={row['stddev_ms']:8.3f}ms")
+                if memory:
+                    _, row["peak_bytes"], row["result_bytes"] = instrument.measure_memory(func, list(frozen_lst), *args)
+                    line += f" peak={row['peak_bytes'] / 1_000_000:9.3f}MB result={row['result_bytes'] / 1_000_000:9.3f}MB"
+                print(line)
+                rows.append(row)
+    return rows
+
+async def _generate_load(service: AlgorithmService, lsts: List[List[int]], kind: str, request_count: int,
+                         concurrency: int, rng: random.Random) -> Tuple[List[int], int]:
+    # keep 'concurrency' requests in flight until request_count requests are answered, while a heartbeat task
+    # measures how late the event loop wakes it up
+    value_top = max(max(lst) for lst in lsts) + 1
+    width = max(len(lsts[0]) // 10, 1)
+    requests = []
+    for number in range(request_count):
+        lst = lsts[number % len(lsts)]
+        request_kind = kind if kind != "both" else (LST_TO_DICT, TARGET_SUM)[number % 2]
+        if request_kind == LST_TO_DICT:
+            start = rng.randrange(value_top)
+            requests.append(service.lst_to_dict(lst, start, start + width - 1))
+        else:
+            requests.append(service.target_sum(lst, rng.randrange(2 * value_top)))
+    # coroutines are only started once awaited, so each client takes the next one when it is done
+    pending = iter(requests)
+    latencies = []
+
+    async def client() -> None:
+        for request in pending:
+            start_time = time.perf_counter_ns()
+            _ = await request
+            latencies.append(time.perf_counter_ns() - start_time)
+
+    max_lag = 0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal max_lag
+        interval = 0.001
+        while not done:
+            expected = time.perf_counter_ns() + interval * 1_000_000_000
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter_ns() - expected)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    done = True
+    await heartbeat_task
+    return latencies, max_lag
+
+def load_test(size: int, concurrency: int, request_count: int = 500, kind: str = "both", list_count: int = 4,
+              density: float = 0.1, seed: int = 0, batch_window: float = 0.002) -> Row:
+    """
+    Measure the latency of AlgorithmService requests under concurrency. list_count frozen inputs of the given size are
+    shared by all requests, so concurrent requests against the same list can be coalesced. lst_to_dict requests
+    query random ranges a tenth as wide as the list, target_sum requests random targets.
+
+    :param size: input list length
+    :param concurrency: number of requests in flight at the same time
+    :param request_count: total number of requests
+    :param kind: 'lst_to_dict', 'target_sum' or 'both' (alternating)
+    :param list_count: number of distinct input lists
+    :param density: fraction of the value range taken by the input integers
+    :param seed: seed of the input generator
+    :param batch_window: seconds the service waits for more requests after the first request of a batch
+    :return: row with p50, p95, p99 and max latency in milliseconds, throughput in requests per second, number of batches,
+        and the longest event loop stall in milliseconds. The p50 is also stored as 'median_ms', for compare.
+    """
+    rng = random.Random(f"{seed}-{size}-{concurrency}-load")
+    lsts = [list(frozen_input(size, density, seed + number)) for number in range(list_count)]
+
+    async def run() -> Tuple[List[int], int, int, float]:
+        async with AlgorithmService(batch_window=batch_window) as service:
+            start_time = time.perf_counter_ns()
+            latencies, max_lag = await _generate_load(service, lsts, kind, request_count, concurrency, rng)
+            elapsed = (time.perf_counter_ns() - start_time) / 1_000_000_000
+            return latencies, max_lag, service.batch_count, elapsed
+
+    latencies, max_lag, batch_count, elapsed = asyncio.run(run())
+    ordered = sorted(latencies)
+    row = {"module": "service", "function": f"AlgorithmService.{kind}[concurrency={concurrency}]", "size": size,
+           "density": density, "requests": request_count, "concurrency": concurrency,
+           "p50_ms": nearest_rank(ordered, 0.5) / 1_000_000, "p95_ms": nearest_rank(ordered, 0.95) / 1_000_000,
+           "p99_ms": nearest_rank(ordered, 0.99) / 1_000_000, "max_ms": ordered[-1] / 1_000_000,
+           "throughput_rps": request_count / elapsed, "batches": batch_count, "max_loop_lag_ms": max_lag / 1_000_000}
+    row["median_ms"] = row["p50_ms"]
+    print(f"{row['function']:<48} size={size:<10} p50={row['p50_ms']:10.3f}ms p95={row['p95_ms']:10.3f}ms "
+          f"p99={row['p99_ms']:10.3f}ms throughput={row['throughput_rps']:9.1f}/s batches={batch_count:<6} "
+          f"max loop lag={row['max_loop_lag_ms']:8.3f}ms")
+    return row
+
+def write_json(rows: List[Row], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(rows, file, indent=2)
+
+def read_json(path: str) -> List[Row]:
+    with open(path) as file:
+        return json.load(file)
+
+def write_csv(rows: List[Row], path: str) -> None:
+    if not rows:
+        return
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def compare(baseline: List[Row], rows: List[Row], tolerance: float = 0.1) -> List[Tuple[str, int, float, float, float]]:
+    """
+    Find measurements whose median got slower than in the baseline by more than the tolerance.
+
+    :param baseline: rows of an earlier run
+    :param rows: rows of the current run
+    :param tolerance: allowed relative slowdown of the median, 0.1 meaning 10%
+    :return: list of (function, size, density, baseline median, current median) tuples for every regression
+    """
+    baseline_medians = {(row["function"], row["size"], row["density"]): row["median_ms"] for row in baseline}
+    regressions = []
+    for row in rows:
+        baseline_median = baseline_medians.get((row["function"], row["size"], row["density"]))
+        if baseline_median is not None and row["median_ms"] > baseline_median * (1 + tolerance):
+            regressions.append((row["function"], row["size"], row["density"], baseline_median, row["median_ms"]))
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the lst_to_dict and target_sum functions.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="input list lengths")
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.5],
+                        help="fractions of the value range taken by the input integers")
+    parser.add_argument("--warmup", type=int, default=1, help="calls before measuring")
+    parser.add_argument("--repeats", type=int, default=7, help="measured calls")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the input generator")
+    parser.add_argument("--memory", action="store_true", help="also record peak allocation and result size")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative slowdown against the baseline")
+    parser.add_argument("--load", action="store_true", help="measure the asyncio service under concurrent load instead")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64], help="requests in flight, with --load")
+    parser.add_argument("--requests", type=int, default=500, help="total requests per load test, with --load")
+    parser.add_argument("--kind", choices=[LST_TO_DICT, TARGET_SUM, "both"], default="both", help="requests, with --load")
+    parser.add_argument("--batch-window", type=float, default=0.002, help="service micro-batch window in seconds, with --load")
+    args = parser.parse_args(argv)
+
+    if args.load:
+        rows = [load_test(size, concurrency, args.requests, args.kind, density=args.densities[0], seed=args.seed,
+                          batch_window=args.batch_window)
+                for size in args.sizes for concurrency in args.concurrency]
+    else:
+        rows = run_suite(args.sizes, args.densities, args.warmup, args.repeats, args.seed, memory=args.memory)
+    if args.json:
+        write_json(rows, args.json)
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.baseline:
+        regressions = compare(read_json(args.baseline), rows, args.tolerance)
+        for function, size, density, baseline_median, median in regressions:
+            print(f"Regression: {function} size={size} density={density} median {baseline_median:.3f}ms -> {median:.3f}ms")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
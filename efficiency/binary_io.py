@@ -0,0 +1,92 @@
+"""
+Binary input files for the lst_to_dict and target_sum functions: flat little-endian int32 or int64 integers, no header.
+
+load_ints maps a file into memory and returns a memoryview over it, so nothing is parsed or copied up front and the
+integers are only turned into Python ints when an engine reads them. All engines accept the memoryview in place of a
+list; lst_to_dict_alg.lst_to_dict and target_sum.target_sum hand it to numpy (if installed), which reads the mapped
+file directly.
+
+Usage, to write the random input of lst_to_dict_alg.single_speed_trial to a file:
+    python -m efficiency write input.bin --length 1000000
+"""
+from typing import List, Iterable, Union
+from array import array
+import argparse
+import mmap
+import os
+import sys
+
+from efficiency import lst_to_dict_alg
+
+# array / memoryview type codes of the supported integer sizes
+INT32 = "i"
+INT64 = "q"
+
+def _check_typecode(typecode: str) -> int:
+    if typecode not in (INT32, INT64):
+        raise ValueError(f"Unsupported typecode {typecode!r}, expected {INT32!r} (int32) or {INT64!r} (int64)")
+    itemsize = array(typecode).itemsize
+    if itemsize != (4 if typecode == INT32 else 8):
+        raise ValueError(f"Typecode {typecode!r} has {itemsize} bytes on this platform")
+    return itemsize
+
+def write_ints(path: str, numbers: Iterable[int], typecode: str = INT64) -> int:
+    """
+    Write integers to a binary file as little-endian int32 or int64.
+
+    :param path: path of the file, which is overwritten
+    :param numbers: integers to write, which must fit into the chosen size
+    :param typecode: INT32 or INT64
+    :return: number of integers written
+    """
+    _check_typecode(typecode)
+    values = array(typecode, numbers)
+    if sys.byteorder == "big":
+        values.byteswap()
+    with open(path, "wb") as file:
+        values.tofile(file)
+    return len(values)
+
+def load_ints(path: str, typecode: str = INT64) -> Union[memoryview, array]:
+    """
+    Map a binary file of little-endian int32 or int64 integers into memory, without reading or copying it.
+    The file stays mapped as long as the returned memoryview (or any slice of it) is referenced.
+    On big-endian platforms the integers have to be byte swapped, so they are read into an array instead.
+
+    :param path: path of the file
+    :param typecode: INT32 or INT64
+    :return: read-only memoryview (or array on big-endian platforms) of the integers, supporting len, indexing,
+        slicing and iteration like a list
+    """
+    itemsize = _check_typecode(typecode)
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(f"Size of {path} ({size} bytes) is not a multiple of {itemsize} bytes")
+    if size == 0:
+        # empty files can't be mapped
+        return memoryview(array(typecode))
+    with open(path, "rb") as file:
+        if sys.byteorder == "big":
+            values = array(typecode)
+            values.fromfile(file, size // itemsize)
+            values.byteswap()
+            return values
+        # the mapping keeps its own handle of the file, so it can be closed here
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(typecode)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write the random input list of the speed trials to a binary file.")
+    parser.add_argument("path", help="output file")
+    parser.add_argument("--length", type=int, required=True, help="desired length of the input list")
+    parser.add_argument("--range-top", type=int, help="greatest number that could be generated, defaults to 10 times the length")
+    parser.add_argument("--int32", action="store_true", help="write int32 instead of int64")
+    args = parser.parse_args(argv)
+
+    numbers = lst_to_dict_alg.random_test_list(args.length, args.range_top)
+    count = write_ints(args.path, numbers, INT32 if args.int32 else INT64)
+    print(f"Wrote {count} integers to {args.path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
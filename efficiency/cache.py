@@ -0,0 +1,161 @@
+"""
+Opt-in result cache for the lst_to_dict and target_sum entry points, for workloads which send the same lists again
+(as new objects with the same content), with overlapping ranges and repeated targets.
+
+Results are keyed by a fingerprint of the content of the list, a blake2b digest of its numbers, plus the parameters.
+The fingerprint is computed on every call, so a list which was modified since it was cached (for example in place, by
+the caller) gets a different fingerprint and is never answered with a stale result. Hashing runs in C and costs a
+fraction of any of the algorithms, but it is O(n) per call, so the cache pays off when results are reused.
+
+lst_to_dict results are RangeIndex objects, which are read-only and shared between callers. A range within a cached
+range of the same list is answered by slicing the cached positions, without looking at the list. Entries are evicted
+in least recently used order when their total size exceeds max_bytes.
+
+Usage:
+    cache = ResultCache(max_bytes=64 * 1024 * 1024)
+    mapping = cache.lst_to_dict(lst, 5, 500)
+    pair = cache.target_sum(lst, 42)
+    print(cache.stats())
+"""
+from typing import List, Dict, Union, Tuple, Set, Any
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+import hashlib
+import sys
+
+from efficiency import lst_to_dict_alg, target_sum
+
+def fingerprint(lst: Union[List[int], memoryview, array]) -> bytes:
+    """
+    Content fingerprint of a list of integers: equal for lists with equal numbers, different (up to blake2b collisions)
+    otherwise. Buffers (memoryview, array) are hashed as they are; lists are converted to 64 bit integers first.
+
+    :param lst: list or buffer of integers
+    :return: 16 byte digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(lst, (memoryview, array)):
+        view = memoryview(lst)
+        digest.update(f"{view.format}:{len(view)}:".encode())
+        digest.update(view.cast("B") if view.c_contiguous else view.tobytes())
+        return digest.digest()
+    try:
+        values = array("q", lst)
+    except OverflowError:
+        # numbers beyond 64 bits, hash their decimal representation instead
+        digest.update(b"repr:")
+        digest.update(repr(list(lst)).encode())
+        return digest.digest()
+    digest.update(f"q:{len(values)}:".encode())
+    digest.update(values)
+    return digest.digest()
+
+class ResultCache:
+    """
+    Byte-bounded LRU cache of lst_to_dict and target_sum results, keyed by the content fingerprint of the list.
+    Counts hits (of which sub_range_hits were answered from a wider cached range), misses and evictions.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        :param max_bytes: greatest total size of the cached results, as measured by sys.getsizeof. Results larger
+            than this are returned without being cached.
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        # cached (start, end) ranges of every list fingerprint, to find ranges containing a query
+        self._ranges: Dict[bytes, Set[Tuple[int, int]]] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.sub_range_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lst_to_dict(self, lst: List[int], start: int, end: int) -> Mapping:
+        """
+        Same result as lst_to_dict_alg.lst_to_dict, from the cache if the same range or a range containing it was
+        cached for a list with the same content.
+
+        :param lst: list or buffer of integers
+        :param start: integer denoting start of range
+        :param end: integer denoting end of range
+        :return: mapping with numbers in range as keys and indices or None as values.
+        """
+        list_fingerprint = fingerprint(lst)
+        key = ("lst_to_dict", list_fingerprint, start, end)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        if start <= end:
+            # the narrowest cached range containing [start, end] - O(cached ranges of the list)
+            containing = [(cached_end - cached_start, cached_start, cached_end)
+                          for cached_start, cached_end in self._ranges.get(list_fingerprint, ())
+                          if cached_start <= start and end <= cached_end]
+            if containing:
+                _, cached_start, cached_end = min(containing)
+                cached_key = ("lst_to_dict", list_fingerprint, cached_start, cached_end)
+                self._entries.move_to_end(cached_key)
+                cached = self._entries[cached_key][0]
+                if isinstance(cached, lst_to_dict_alg.RangeIndex):
+                    self.hits += 1
+                    self.sub_range_hits += 1
+                    return cached.sub_range(start, end)
+        self.misses += 1
+        result = lst_to_dict_alg.lst_to_dict(lst, start, end)
+        self._store(key, result)
+        return result
+
+    def target_sum(self, lst: List[int], target: int) -> Tuple[int]:
+        """
+        Same result as target_sum.target_sum, from the cache if the same target was cached for a list with the same content.
+
+        :param lst: list or buffer of integers
+        :param target: target number to which two numbers in the list should add up to
+        :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+        """
+        key = ("target_sum", fingerprint(lst), target)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        self.misses += 1
+        result = target_sum.target_sum(lst, target)
+        self._store(key, result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: dict with the counters, the number of entries and their total size in bytes
+        """
+        return {"hits": self.hits, "sub_range_hits": self.sub_range_hits, "misses": self.misses,
+                "evictions": self.evictions, "entries": len(self._entries), "bytes": self.bytes}
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the counters."""
+        self._entries.clear()
+        self._ranges.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Tuple, result: Any) -> None:
+        size = sys.getsizeof(result) + sys.getsizeof(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (result, size)
+        self.bytes += size
+        if key[0] == "lst_to_dict":
+            self._ranges.setdefault(key[1], set()).add(key[2:])
+        # evict least recently used entries - O(evicted entries)
+        while self.bytes > self.max_bytes:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+            if evicted_key[0] == "lst_to_dict":
+                ranges = self._ranges[evicted_key[1]]
+                ranges.discard(evicted_key[2:])
+                if not ranges:
+                    del self._ranges[evicted_key[1]]
@@ -0,0 +1,259 @@
+"""
+Command line driver for the lst_to_dict and target_sum functions.
+
+'run' times one engine on a generated input (of the given size and distribution) or on an input file, and prints the
+timings and a summary of the result as JSON, for scripts to consume. 'tests' runs the correctness tests and speed
+trials of lst_to_dict_alg or target_sum, 'engines' lists the engines, and 'write' writes a random input file
+(see binary_io).
+
+Usage:
+    python -m efficiency run lst_to_dict --engine range --size 1000000 --distribution clustered --repeats 9
+    python -m efficiency run target_sum --engine parallel --workers 4 --input input.bin --target 42
+    python -m efficiency tests target_sum --input-length 100000 --trials 5 --no-comparative
+    python -m efficiency engines
+    python -m efficiency write input.bin --length 1000000
+"""
+from typing import List, Dict, Union, Any
+from array import array
+import argparse
+import functools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+from efficiency import backends, binary_io, instrument, lst_to_dict_alg, parallel, target_sum
+
+LST_TO_DICT = "lst_to_dict"
+TARGET_SUM = "target_sum"
+
+ENGINES = {
+    LST_TO_DICT: {"auto": lst_to_dict_alg.lst_to_dict, **lst_to_dict_alg.LST_TO_DICT_STRATEGIES},
+    TARGET_SUM: {"auto": target_sum.target_sum, **target_sum.TARGET_SUM_STRATEGIES},
+}
+
+# engines which take 'workers' and 'executor' arguments
+PARALLEL_ENGINES = {"parallel"}
+
+NUMPY_ENGINES = {"numpy"}
+
+DISTRIBUTIONS = ["uniform", "clustered", "sorted", "duplicates", "negative"]
+
+FORMATS = {"int64": binary_io.INT64, "int32": binary_io.INT32, "text": None}
+
+def generate_input(size: int, distribution: str, seed: int = 0) -> List[int]:
+    """
+    Generate an input list, the same for the same arguments. Numbers are drawn from [0, 10 * size) like in the speed
+    trials of lst_to_dict_alg, and are distinct unless the distribution says otherwise.
+    - 'uniform': distinct numbers in random order.
+    - 'clustered': numbers around a few random centers, one per 1000 numbers, which repeat within a cluster.
+    - 'sorted': distinct numbers in ascending order.
+    - 'duplicates': numbers drawn with replacement from [0, size / 4), so each occurs about 4 times.
+    - 'negative': distinct numbers in random order from [-5 * size, 5 * size).
+
+    :param size: length of the list
+    :param distribution: one of DISTRIBUTIONS
+    :param seed: seed of the random generator
+    :return: list of integers
+    """
+    rng = random.Random(f"{seed}-{size}-{distribution}")
+    value_top = max(size * 10, 1)
+    if distribution == "uniform":
+        return rng.sample(range(value_top), size)
+    if distribution == "clustered":
+        centers = [rng.randrange(value_top) for _ in range(max(size // 1000, 1))]
+        spread = max(value_top // (20 * len(centers)), 1)
+        return [max(int(rng.gauss(rng.choice(centers), spread)), 0) for _ in range(size)]
+    if distribution == "sorted":
+        return sorted(rng.sample(range(value_top), size))
+    if distribution == "duplicates":
+        return rng.choices(range(max(size // 4, 1)), k=size)
+    if distribution == "negative":
+        return rng.sample(range(-value_top // 2, value_top // 2), size)
+    raise ValueError(f"Unknown distribution {distribution!r}, expected one of {DISTRIBUTIONS}")
+
+def load_input(path: str, input_format: str) -> Union[List[int], memoryview, array]:
+    """
+    :param path: input file, flat little-endian integers (see binary_io) or whitespace separated decimal integers
+    :param input_format: 'int64', 'int32' or 'text'
+    :return: memoryview over the mapped file for binary formats, list of integers for text
+    """
+    if FORMATS[input_format] is not None:
+        return binary_io.load_ints(path, FORMATS[input_format])
+    with open(path, "rb") as file:
+        return list(target_sum.read_ints(file))
+
+def summarize_result(function: str, result: Any) -> Dict[str, Any]:
+    """
+    :param function: LST_TO_DICT or TARGET_SUM
+    :param result: result of an engine of the function
+    :return: JSON serializable summary of the result
+    """
+    if function == TARGET_SUM:
+        return {"pair": list(result) if result is not None else None}
+    if backends.is_ndarray(result):
+        return {"type": type(result).__name__, "keys": len(result), "found": int((result >= 0).sum())}
+    return {"type": type(result).__name__, "keys": len(result), "found": sum(value is not None for value in result.values())}
+
+def run(function: str, engine: str, lst: Union[List[int], memoryview, array], args: tuple, repeats: int = 5,
+        warmup: int = 1, workers: int = None) -> Dict[str, Any]:
+    """
+    Time an engine of a function, 'warmup' calls without measuring, then 'repeats' measured calls. Parallel engines
+    get a process pool which is started before the measured calls.
+
+    :param function: LST_TO_DICT or TARGET_SUM
+    :param engine: key of ENGINES[function]
+    :param lst: input list
+    :param args: arguments after the list, (start, end) or (target,)
+    :param repeats: number of measured calls, at least 1
+    :param warmup: number of calls before measuring
+    :param workers: number of worker processes of a parallel engine, defaults to the number of CPUs
+    :return: dict with the arguments, the time of every call and their median, min and mean in milliseconds, the median
+        time of every phase of instrumented engines (see instrument.py) and a summary of the result
+    """
+    func = ENGINES[function][engine]
+    executor = None
+    if engine in PARALLEL_ENGINES:
+        workers = workers or os.cpu_count()
+        executor = parallel.process_pool(workers, started=True)
+        func = functools.partial(func, workers=workers, executor=executor)
+    try:
+        for _ in range(warmup):
+            _ = func(lst, *args)
+        times = []
+        with instrument.capture() as records:
+            for _ in range(repeats):
+                start_time = time.perf_counter_ns()
+                result = func(lst, *args)
+                times.append((time.perf_counter_ns() - start_time) / 1_000_000)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    phases: Dict[str, List[float]] = {}
+    for record in records:
+        for name, seconds, _, _ in record.phases:
+            phases.setdefault(f"{record.function}.{name}", []).append(seconds * 1000)
+    return {
+        "function": function,
+        "engine": engine,
+        "length": len(lst),
+        "args": list(args),
+        "workers": workers,
+        "times_ms": times,
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "mean_ms": statistics.fmean(times),
+        "phases_median_ms": {name: statistics.median(samples) for name, samples in phases.items()},
+        "result": summarize_result(function, result),
+    }
+
+def _run_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if args.engine in NUMPY_ENGINES and not backends.has_numpy():
+        parser.error(f"engine {args.engine!r} requires numpy to be installed")
+    if args.workers is not None and args.engine not in PARALLEL_ENGINES:
+        parser.error(f"--workers only applies to the engines {sorted(PARALLEL_ENGINES)}")
+    if args.input is not None:
+        lst = load_input(args.input, args.format)
+        source = {"input": args.input, "format": args.format}
+    else:
+        lst = generate_input(args.size, args.distribution, args.seed)
+        source = {"distribution": args.distribution, "seed": args.seed}
+    rng = random.Random(args.seed)
+    low, high = (min(lst), max(lst)) if len(lst) else (0, 0)
+    if args.function == LST_TO_DICT:
+        # defaults to the lower half of the numbers in the input
+        start = low if args.start is None else args.start
+        end = low + (high - low) // 2 if args.end is None else args.end
+        call_args = (start, end)
+    else:
+        # defaults to a random number between the sums of the two smallest and two greatest numbers
+        target = rng.randrange(2 * low, 2 * high + 1) if args.target is None else args.target
+        call_args = (target,)
+    result = run(args.function, args.engine, lst, call_args, args.repeats, args.warmup, args.workers)
+    result.update(source)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+def _tests_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    options = {"io_correctness": args.io, "comparative_correctness": args.comparative, "speed": args.speed,
+               "memory": args.memory}
+    if args.input_length is not None:
+        options["input_length"] = args.input_length
+    if args.module == LST_TO_DICT:
+        if args.trials is not None:
+            parser.error("--trials only applies to target_sum")
+        lst_to_dict_alg.run_tests(slow=args.slow, **options)
+    else:
+        if args.slow:
+            parser.error("--slow only applies to lst_to_dict, target_sum_slow is always timed")
+        if args.trials is not None:
+            options["trials"] = args.trials
+        target_sum.run_tests(**options)
+    return 0
+
+def _engines_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    for function, engines in ENGINES.items():
+        for engine, func in engines.items():
+            notes = []
+            if engine in NUMPY_ENGINES and not backends.has_numpy():
+                notes.append("unavailable, requires numpy")
+            if engine in PARALLEL_ENGINES:
+                notes.append("takes --workers")
+            print(f"{function} {engine:<10} {func.__name__}" + (f" ({', '.join(notes)})" if notes else ""))
+    return 0
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m efficiency", description="Run and time the lst_to_dict and target_sum functions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time one engine and print the results as JSON")
+    run_parser.add_argument("function", choices=list(ENGINES))
+    run_parser.add_argument("--engine", default="auto", help="engine of the function, see 'engines' (default: auto)")
+    run_parser.add_argument("--size", type=int, default=1_000_000, help="length of the generated input list")
+    run_parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform", help="numbers of the generated input list")
+    run_parser.add_argument("--seed", type=int, default=0, help="seed of the input generator and of the default target")
+    run_parser.add_argument("--input", help="read the input list from this file instead of generating it")
+    run_parser.add_argument("--format", choices=list(FORMATS), default="int64", help="format of the --input file")
+    run_parser.add_argument("--start", type=int, help="start of the lst_to_dict range, defaults to the smallest number")
+    run_parser.add_argument("--end", type=int, help="end of the lst_to_dict range, defaults to the middle of the numbers")
+    run_parser.add_argument("--target", type=int, help="target_sum target, defaults to a random number in range of the input")
+    run_parser.add_argument("--repeats", type=int, default=5, help="measured calls")
+    run_parser.add_argument("--warmup", type=int, default=1, help="calls before measuring")
+    run_parser.add_argument("--workers", type=int, help="worker processes of the parallel engine, defaults to the number of CPUs")
+    run_parser.add_argument("--output", help="write the JSON results to this file instead of printing them")
+    run_parser.set_defaults(handler=_run_command)
+
+    tests_parser = commands.add_parser("tests", help="run the correctness tests and speed trials of a module")
+    tests_parser.add_argument("module", choices=[LST_TO_DICT, TARGET_SUM])
+    tests_parser.add_argument("--input-length", type=int, help="input length of the speed trials")
+    tests_parser.add_argument("--trials", type=int, help="speed trials per target_sum function (default: 20)")
+    tests_parser.add_argument("--slow", action="store_true", help="also time lst_to_dict_slow, which is quadratic")
+    tests_parser.add_argument("--memory", action="store_true", help="also measure peak memory")
+    tests_parser.add_argument("--no-io", dest="io", action="store_false", help="skip the input/output tests")
+    tests_parser.add_argument("--no-comparative", dest="comparative", action="store_false", help="skip the comparative tests")
+    tests_parser.add_argument("--no-speed", dest="speed", action="store_false", help="skip the speed trials")
+    tests_parser.set_defaults(handler=_tests_command)
+
+    engines_parser = commands.add_parser("engines", help="list the engines of every function")
+    engines_parser.set_defaults(handler=_engines_command)
+
+    # handled by binary_io.main, which parses its own arguments
+    commands.add_parser("write", help="write a random input file, see 'write --help'", add_help=False)
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["write"]:
+        return binary_io.main(argv[1:])
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        if args.engine not in ENGINES[args.function]:
+            parser.error(f"unknown engine {args.engine!r} of {args.function}, expected one of {list(ENGINES[args.function])}")
+        if args.repeats < 1:
+            parser.error("--repeats must be at least 1")
+    return args.handler(parser, args)
@@ -0,0 +1,449 @@
+"""
+Differential fuzzing of every lst_to_dict and target_sum engine against brute force references.
+
+Random cases are generated in batches across several shapes (empty lists, tiny lists, duplicates, negative numbers, wide
+values, numbers around and beyond the bounds of 64 bit integers, sorted lists, start > end, ranges ending exactly at the
+smallest and greatest number), and every engine is run over a whole batch before moving on to the next engine. Engines
+which promise the result of lst_to_dict_simple or target_sum_hash have to match the reference exactly. lst_to_dict_slow
+(first index of duplicates), target_sum_slow and target_sum_fast (any pair) only have to return a valid result, found
+exactly when the reference finds one. Engines which modify their input or raise fail as well. Known failures
+(EXPECTED_FAILURES, the original target_sum_fast) are reported, but only other failures make the run exit with status 1.
+The first failing case of every engine is shrunk to a minimal one: each shrinking pass builds a batch of smaller
+candidates (shorter list, smaller numbers, narrower range, smaller target) and keeps the first candidate which still
+fails, until no candidate does.
+
+Usage:
+    python -m efficiency.fuzz --cases 5000 --seed 1
+    python -m efficiency.fuzz --engines target_sum_fast target_sum_bitset
+"""
+from typing import List, Dict, Callable, Tuple, Iterator, Any, NamedTuple
+from array import array
+from collections.abc import Mapping
+import argparse
+import random
+import sys
+import time
+
+from efficiency import backends, inputs, lst_to_dict_alg, target_sum
+from efficiency.cache import ResultCache
+from efficiency.parallel import process_pool
+
+SHAPES = ("empty", "tiny", "duplicates", "negatives", "wide", "huge", "sorted", "reversed_range", "edges", "uniform")
+
+# numbers of the 'huge' shape are picked around these, to reach the bounds of 64 bit integers and beyond
+HUGE_NUMBERS = (-2 ** 70, -2 ** 64, -2 ** 63, -2 ** 62, 0, 2 ** 62, 2 ** 63 - 1, 2 ** 63, 2 ** 64, 2 ** 70)
+
+# half of the 'huge' lists are clamped into 64 bits, so that engines which only accept those (buffers, arrays) get
+# numbers at the bounds as well. Their targets are sometimes picked around 2^64, beyond the sum of any two of them
+HUGE_TARGETS = (-2 ** 64 - 1, -2 ** 64, -2 ** 64 + 1, 2 ** 64 - 2, 2 ** 64 - 1, 2 ** 64)
+
+# parallel engines start work in other processes for every call, so they only get every n-th case
+PARALLEL_EVERY = 10
+
+# target_sum_fast loops up to half of the target, so it only gets cases with targets up to this size
+FAST_MAX_TARGET = 10_000
+
+# engines which are known to fail, with the reason. Their failures are reported without failing the run, so that
+# the exit status only reflects new failures
+EXPECTED_FAILURES = {
+    "target_sum_fast": "the original implementation pairs a number with itself and misses negative numbers",
+}
+
+# greatest length of the lists passed to k_sum, whose brute force reference is O(n^3)
+K_SUM_MAX_LENGTH = 12
+
+class Case:
+    """
+    Input of one fuzzing case, shared by the lst_to_dict engines (lst, start, end) and the target_sum engines (lst, target).
+    Brute force references are computed once per case and cached.
+    """
+
+    __slots__ = ("lst", "start", "end", "target", "_expected", "_sorted")
+
+    def __init__(self, lst: List[int], start: int, end: int, target: int) -> None:
+        self.lst = lst
+        self.start = start
+        self.end = end
+        self.target = target
+        self._expected = {}
+        self._sorted = None
+
+    def expected(self, reference: Callable[["Case"], Any]) -> Any:
+        """
+        :param reference: brute force reference function
+        :return: cached result of reference(self)
+        """
+        if reference not in self._expected:
+            self._expected[reference] = reference(self)
+        return self._expected[reference]
+
+    def sorted_case(self) -> "Case":
+        """
+        :return: the same case with the list sorted, for engines which require a sorted list
+        """
+        if self._sorted is None:
+            self._sorted = self if self.lst == sorted(self.lst) else Case(sorted(self.lst), self.start, self.end, self.target)
+        return self._sorted
+
+    def replace(self, **changes: Any) -> "Case":
+        fields = {"lst": self.lst, "start": self.start, "end": self.end, "target": self.target}
+        fields.update(changes)
+        return Case(**fields)
+
+    def __repr__(self) -> str:
+        return f"Case(lst={self.lst}, start={self.start}, end={self.end}, target={self.target})"
+
+class Engine(NamedTuple):
+    name: str
+    call: Callable[[Case], Any]
+    check: Callable[[Case, Any], str]
+    needs_sorted: bool = False
+    every: int = 1
+    accepts: Callable[[Case], bool] = None
+
+def fits_int64(case: Case) -> bool:
+    # engines which store the list as 64 bit integers (buffers, ValueIndex, shared memory) only get cases which fit
+    return inputs.fits_int64(*case.lst)
+
+def reference_dict(case: Case) -> Dict[int, int]:
+    # last index of every number in range, or None - O(len(range) * n)
+    return {key: max((index for index, value in enumerate(case.lst) if value == key), default=None)
+            for key in range(case.start, case.end + 1)}
+
+def reference_pairs(case: Case) -> List[Tuple[int, int]]:
+    # all pairs in order of second index, then first index - O(n^2)
+    lst = case.lst
+    return [(i, j) for j in range(len(lst)) for i in range(j) if lst[i] + lst[j] == case.target]
+
+def reference_pair(case: Case) -> Tuple[int, int]:
+    # first completed pair, i.e. the first of reference_pairs
+    pairs = case.expected(reference_pairs)
+    return pairs[0] if pairs else None
+
+def reference_k_sum(case: Case) -> Tuple[int, ...]:
+    return target_sum.k_sum_slow(case.lst[:K_SUM_MAX_LENGTH], case.target, 3)
+
+def check_mapping(case: Case, result: Any) -> str:
+    expected = case.expected(reference_dict)
+    if not isinstance(result, Mapping) or result != expected:
+        shown = dict(result.items()) if isinstance(result, Mapping) else result
+        return f"returned {shown}, expected {expected}"
+    return None
+
+def check_valid_mapping(case: Case, result: Any) -> str:
+    # any index of a number is accepted, not only the last one
+    expected = case.expected(reference_dict)
+    if not isinstance(result, Mapping) or set(result) != set(expected):
+        return f"returned keys {sorted(result) if isinstance(result, Mapping) else result}, expected {sorted(expected)}"
+    for key, index in result.items():
+        if (index is None) != (expected[key] is None) or (index is not None and case.lst[index] != key):
+            return f"returned {key}: {index}, expected {expected[key]} or another index of {key}"
+    return None
+
+def check_pair(case: Case, result: Any) -> str:
+    expected = case.expected(reference_pair)
+    if result != expected or (result is not None and not isinstance(result, tuple)):
+        return f"returned {result!r}, expected {expected!r}"
+    return None
+
+def check_valid_pair(case: Case, result: Any) -> str:
+    # any pair is accepted, but only if there is one
+    expected = case.expected(reference_pair)
+    if result is None:
+        return None if expected is None else f"returned None, expected a pair like {expected}"
+    if expected is None:
+        return f"returned {result!r}, expected None"
+    i, j = result
+    if not 0 <= i < j < len(case.lst) or case.lst[i] + case.lst[j] != case.target:
+        return f"returned {result!r}, which is not a pair adding up to {case.target}"
+    return None
+
+def check_pairs(case: Case, result: Any) -> str:
+    expected = case.expected(reference_pairs)
+    return None if result == expected else f"returned {result!r}, expected {expected!r}"
+
+def check_count(case: Case, result: Any) -> str:
+    expected = len(case.expected(reference_pairs))
+    return None if result == expected else f"returned {result!r}, expected {expected}"
+
+def check_k_sum(case: Case, result: Any) -> str:
+    expected = case.expected(reference_k_sum)
+    lst = case.lst[:K_SUM_MAX_LENGTH]
+    if result is None:
+        return None if expected is None else f"returned None, expected indices like {expected}"
+    if (expected is None or len(result) != 3 or list(result) != sorted(set(result)) or result[0] < 0
+            or result[-1] >= len(lst) or sum(lst[index] for index in result) != case.target):
+        return f"returned {result!r}, expected {expected!r} or other indices adding up to {case.target}"
+    return None
+
+def value_index_appended(case: Case) -> Mapping:
+    # index half of the list, append the rest, to check the incremental path too
+    half = len(case.lst) // 2
+    index = lst_to_dict_alg.ValueIndex(case.lst[:half])
+    for value in case.lst[half:]:
+        index.append(value)
+    return index.query(case.start, case.end)
+
+def value_index_updated(case: Case) -> Mapping:
+    # index the reversed list, then update every number to the one of the list, to check the in place updates too
+    index = lst_to_dict_alg.ValueIndex(case.lst[::-1])
+    for position, value in enumerate(case.lst):
+        index.update(position, value)
+    return index.query(case.start, case.end)
+
+def engines(executor: "ProcessPoolExecutor" = None) -> List[Engine]:
+    """
+    :param executor: process pool for the parallel engines, which are left out if not given
+    :return: every engine which can run here, with the check its result has to pass
+    """
+    ltd = lst_to_dict_alg
+    ts = target_sum
+    # shared by all cases, so later cases are answered from the results (and ranges) of earlier ones
+    cache = ResultCache(max_bytes=1 << 20)
+    result = [
+        Engine("lst_to_dict_slow", lambda c: ltd.lst_to_dict_slow(c.lst, c.start, c.end), check_valid_mapping),
+        Engine("lst_to_dict_fast", lambda c: ltd.lst_to_dict_fast(c.lst, c.start, c.end), check_mapping),
+        Engine("lst_to_dict_simple", lambda c: ltd.lst_to_dict_simple(c.lst, c.start, c.end), check_mapping),
+        Engine("lst_to_dict_range", lambda c: ltd.lst_to_dict_range(c.lst, c.start, c.end), check_mapping),
+        Engine("lst_to_dict_bitset", lambda c: ltd.lst_to_dict_bitset(c.lst, c.start, c.end), check_mapping),
+        Engine("lst_to_dict_sorted", lambda c: ltd.lst_to_dict_sorted(c.lst, c.start, c.end), check_mapping, needs_sorted=True),
+        Engine("lst_to_dict", lambda c: ltd.lst_to_dict(c.lst, c.start, c.end), check_mapping),
+        Engine("lst_to_dict(buffer)", lambda c: ltd.lst_to_dict(memoryview(array("q", c.lst)), c.start, c.end), check_mapping,
+               accepts=fits_int64),
+        Engine("ValueIndex.query", lambda c: ltd.ValueIndex(c.lst).query(c.start, c.end), check_mapping, accepts=fits_int64),
+        Engine("ValueIndex.append", value_index_appended, check_mapping, accepts=fits_int64),
+        Engine("ValueIndex.update", value_index_updated, check_mapping, accepts=fits_int64),
+        Engine("ResultCache.lst_to_dict", lambda c: cache.lst_to_dict(c.lst, c.start, c.end), check_mapping),
+        Engine("target_sum_slow", lambda c: ts.target_sum_slow(c.lst, c.target), check_valid_pair),
+        Engine("target_sum_fast", lambda c: ts.target_sum_fast(c.lst, c.target), check_valid_pair,
+               accepts=lambda c: abs(c.target) <= FAST_MAX_TARGET),
+        Engine("target_sum_hash", lambda c: ts.target_sum_hash(c.lst, c.target), check_pair),
+        Engine("target_sum_bitset", lambda c: ts.target_sum_bitset(c.lst, c.target), check_pair),
+        Engine("target_sum_sorted", lambda c: ts.target_sum_sorted(c.lst, c.target), check_pair, needs_sorted=True),
+        Engine("target_sum", lambda c: ts.target_sum(c.lst, c.target), check_pair),
+        Engine("target_sum(buffer)", lambda c: ts.target_sum(memoryview(array("q", c.lst)), c.target), check_pair,
+               accepts=fits_int64),
+        Engine("target_sum_many(hash)", lambda c: ts.target_sum_many(c.lst, [c.target], "hash")[0], check_pair),
+        Engine("target_sum_stream", lambda c: next(ts.target_sum_stream(iter(c.lst), c.target), None), check_pair),
+        Engine("target_sum_all", lambda c: list(ts.target_sum_all(c.lst, c.target)), check_pairs),
+        Engine("ResultCache.target_sum", lambda c: cache.target_sum(c.lst, c.target), check_pair),
+        Engine("target_sum_count", lambda c: ts.target_sum_count(c.lst, c.target), check_count),
+        Engine("k_sum(k=3)", lambda c: ts.k_sum(c.lst[:K_SUM_MAX_LENGTH], c.target, 3), check_k_sum),
+    ]
+    if backends.has_numpy():
+        result += [
+            Engine("lst_to_dict_numpy", lambda c: ltd.lst_to_dict_numpy(c.lst, c.start, c.end), check_mapping),
+            Engine("target_sum_numpy", lambda c: ts.target_sum_numpy(c.lst, c.target), check_pair),
+            Engine("target_sum(ndarray)", lambda c: ts.target_sum(backends.numpy().array(c.lst, dtype="int64"), c.target),
+                   check_pair, accepts=fits_int64),
+            Engine("target_sum_many(numpy)", lambda c: ts.target_sum_many(c.lst, [c.target], "numpy")[0], check_pair),
+            Engine("target_sum_many(auto)", lambda c: ts.target_sum_many(c.lst, [c.target], "auto", 1)[0], check_pair),
+        ]
+    if executor is not None:
+        result += [
+            Engine("lst_to_dict_parallel", lambda c: ltd.lst_to_dict_parallel(c.lst, c.start, c.end, 2, executor),
+                   check_mapping, every=PARALLEL_EVERY, accepts=fits_int64),
+            Engine("target_sum_parallel", lambda c: ts.target_sum_parallel(c.lst, c.target, 2, executor),
+                   check_pair, every=PARALLEL_EVERY, accepts=fits_int64),
+        ]
+    return result
+
+def random_case(rng: random.Random, max_len: int = 40) -> Case:
+    """
+    :param rng: random generator
+    :param max_len: greatest length of the list
+    :return: random case of a randomly chosen shape
+    """
+    shape = rng.choice(SHAPES)
+    if shape == "empty":
+        length = 0
+    elif shape == "tiny":
+        length = rng.randrange(1, 4)
+    else:
+        length = rng.randrange(max_len + 1)
+    if shape == "duplicates":
+        low, high = 0, rng.randrange(1, 6)
+    elif shape == "negatives":
+        low, high = -50, 50
+    elif shape == "wide":
+        low, high = -(1 << 40), 1 << 40
+    elif shape == "huge":
+        low, high = HUGE_NUMBERS[0], HUGE_NUMBERS[-1]
+    else:
+        low, high = 0, 60
+    if shape == "huge":
+        lst = [rng.choice(HUGE_NUMBERS) + rng.randint(-3, 3) for _ in range(length)]
+        if rng.random() < 0.5:
+            lst = [min(max(number, inputs.INT64_MIN), inputs.INT64_MAX) for number in lst]
+    else:
+        lst = [rng.randint(low, high) for _ in range(length)]
+    if shape == "sorted":
+        lst.sort()
+    # ranges around the numbers, but never much wider than the list, as the result has an entry per number of the range
+    center = rng.choice(lst) if lst else rng.randint(low, min(high, low + 100))
+    start = center - rng.randrange(30)
+    end = start + rng.randrange(60)
+    if shape == "reversed_range":
+        end = start - rng.randrange(1, 10)
+    elif shape == "edges" and lst:
+        start, end = min(lst), max(lst)
+        if end - start > 200:
+            start, end = (start, start + 1) if rng.random() < 0.5 else (end - 1, end)
+    if shape == "huge" and rng.random() < 0.25:
+        target = rng.choice(HUGE_TARGETS)
+    elif length >= 2 and rng.random() < 0.5:
+        # target of an existing pair
+        i, j = rng.sample(range(length), 2)
+        target = lst[i] + lst[j]
+    else:
+        target = rng.randint(2 * (min(lst) if lst else low) - 5, 2 * (max(lst) if lst else high) + 5)
+    return Case(lst, start, end, target)
+
+def run_engine(engine: Engine, case: Case) -> str:
+    """
+    :param engine: engine to run
+    :param case: input case
+    :return: description of the failure, or None if the engine passed
+    """
+    if engine.needs_sorted:
+        case = case.sorted_case()
+    lst_copy = list(case.lst)
+    try:
+        result = engine.call(case)
+    except Exception as error:
+        return f"raised {type(error).__name__}: {error}"
+    if case.lst != lst_copy:
+        return f"modified its input list to {case.lst}"
+    return engine.check(case, result)
+
+def shrink_candidates(case: Case) -> Iterator[Case]:
+    """
+    Smaller variants of a case, most aggressive first: chunks of the list removed (halves down to single numbers),
+    numbers replaced by zero or halved, the range narrowed, and the target moved towards zero.
+    """
+    lst = case.lst
+    size = len(lst) // 2
+    while size >= 1:
+        for chunk_start in range(0, len(lst), size):
+            yield case.replace(lst=lst[:chunk_start] + lst[chunk_start + size:])
+        size //= 2
+    for index, value in enumerate(lst):
+        for smaller in (0, int(value / 2), value - 1 if value > 0 else value + 1):
+            if abs(smaller) < abs(value):
+                yield case.replace(lst=lst[:index] + [smaller] + lst[index + 1:])
+                # keep the sums with this number, which target_sum failures usually depend on
+                yield case.replace(lst=lst[:index] + [smaller] + lst[index + 1:], target=case.target - value + smaller)
+    if case.end - case.start >= 1:
+        yield case.replace(start=case.start + 1)
+        yield case.replace(end=case.end - 1)
+    for start in (0, int(case.start / 2)):
+        if abs(start) < abs(case.start):
+            yield case.replace(start=start, end=case.end - (case.start - start))
+    for target in (0, int(case.target / 2), case.target - 1 if case.target > 0 else case.target + 1):
+        if abs(target) < abs(case.target):
+            yield case.replace(target=target)
+
+def shrink(engine: Engine, case: Case, batch_size: int = 64) -> Tuple[Case, str]:
+    """
+    Shrink a failing case to a minimal one: candidates are generated and run in batches, and the first failing
+    candidate replaces the case, until no candidate fails.
+
+    :param engine: engine which fails on the case
+    :param case: failing case
+    :param batch_size: number of candidates run at a time
+    :return: minimal failing case and its failure
+    """
+    failure = run_engine(engine, case)
+    progress = True
+    while progress:
+        progress = False
+        candidates = shrink_candidates(case)
+        while not progress:
+            batch = [candidate for _, candidate in zip(range(batch_size), candidates)]
+            if not batch:
+                break
+            for candidate in batch:
+                if engine.accepts is not None and not engine.accepts(candidate):
+                    continue
+                candidate_failure = run_engine(engine, candidate)
+                if candidate_failure is not None:
+                    case, failure, progress = candidate, candidate_failure, True
+                    break
+    return case, failure
+
+def fuzz(case_count: int = 5000, seed: int = 0, batch_size: int = 500, engine_names: List[str] = None,
+         max_len: int = 40, parallel: bool = True) -> Dict[str, Tuple[int, int, Case, str]]:
+    """
+    Run every engine on case_count random cases, in batches of batch_size cases.
+
+    :param case_count: number of random cases
+    :param seed: seed of the case generator
+    :param batch_size: number of cases generated and run at a time
+    :param engine_names: names of the engines to run, defaults to all of them
+    :param max_len: greatest length of the random lists
+    :param parallel: also run the parallel engines, on every PARALLEL_EVERY-th case
+    :return: dict with engine names as keys and tuples of (cases run, failures, minimal failing case or None,
+        its failure or None) as values
+    """
+    rng = random.Random(seed)
+    executor = process_pool(2) if parallel else None
+    try:
+        selected = [engine for engine in engines(executor) if engine_names is None or engine.name in engine_names]
+        if engine_names is not None:
+            unknown = set(engine_names) - {engine.name for engine in selected}
+            if unknown:
+                raise ValueError(f"Unknown engines {sorted(unknown)}")
+        runs = dict.fromkeys((engine.name for engine in selected), 0)
+        failures = dict.fromkeys(runs, 0)
+        first_failures = {}
+        for batch_start in range(0, case_count, batch_size):
+            batch = [random_case(rng, max_len) for _ in range(min(batch_size, case_count - batch_start))]
+            for engine in selected:
+                for number, case in enumerate(batch, batch_start):
+                    if number % engine.every or (engine.accepts is not None and not engine.accepts(case)):
+                        continue
+                    runs[engine.name] += 1
+                    if run_engine(engine, case) is not None:
+                        failures[engine.name] += 1
+                        first_failures.setdefault(engine.name, case)
+        results = {}
+        for engine in selected:
+            if engine.name in first_failures:
+                minimal_case, failure = shrink(engine, first_failures[engine.name])
+            else:
+                minimal_case, failure = None, None
+            results[engine.name] = (runs[engine.name], failures[engine.name], minimal_case, failure)
+        return results
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the lst_to_dict and target_sum engines.")
+    parser.add_argument("--cases", type=int, default=5000, help="number of random cases")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the case generator")
+    parser.add_argument("--batch-size", type=int, default=500, help="cases generated and run at a time")
+    parser.add_argument("--max-len", type=int, default=40, help="greatest length of the random lists")
+    parser.add_argument("--engines", nargs="+", help="engines to run, defaults to all of them")
+    parser.add_argument("--no-parallel", action="store_true", help="skip the parallel engines")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    results = fuzz(args.cases, args.seed, args.batch_size, args.engines, args.max_len, not args.no_parallel)
+    elapsed_time = time.perf_counter() - start_time
+    failed = False
+    for name, (run_count, failure_count, minimal_case, failure) in results.items():
+        print(f"{name:<24} {run_count:>6} cases {failure_count:>6} failures")
+        if minimal_case is not None:
+            if name in EXPECTED_FAILURES:
+                print(f"    expected failure: {EXPECTED_FAILURES[name]}")
+            else:
+                failed = True
+            print(f"    minimal failing case: {minimal_case}")
+            print(f"    {name} {failure}")
+    print(f"Fuzzed {len(results)} engines with {args.cases} cases in {elapsed_time:.3f}s "
+          f"({args.cases / max(elapsed_time, 1e-9):.0f} cases per second).")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Input lists as the engines and dispatchers of lst_to_dict_alg and target_sum see them: the bounds of the 64 bit integers
+which numpy, shared memory and binary files hold, the conversion of lists and buffers to numpy arrays, and the cheap
+statistics the dispatchers choose a strategy from.
+"""
+from typing import List, Dict, Union, Any
+from array import array
+import itertools
+import operator
+
+from efficiency import backends
+
+# bounds of the 64 bit integers used by the numpy engines, shared memory and binary files
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# lists shorter than this are not worth converting to numpy arrays
+NUMPY_MIN_LENGTH = 10_000
+
+def fits_int64(*numbers: int) -> bool:
+    """
+    :param numbers: integers
+    :return: True if all numbers fit into a signed 64 bit integer
+    """
+    return all(INT64_MIN <= number <= INT64_MAX for number in numbers)
+
+def numpy_values(lst: Union[List[int], "np.ndarray"]) -> "np.ndarray":
+    """
+    View a numpy array or buffer (such as the memoryview returned by binary_io.load_ints) as a numpy array of its own
+    integer type, without copying it, or convert a list to an array of 64 bit integers. The numpy engines widen only
+    the numbers they select, so an int32 file mapped into memory is not copied into an int64 array first.
+
+    :param lst: list, numpy array or buffer of integers
+    :return: numpy array of integers
+    :raises OverflowError: if a number of a list does not fit into 64 bits
+    """
+    np = backends.numpy()
+    if isinstance(lst, (memoryview, array)) or backends.is_ndarray(lst):
+        values = np.asarray(lst)
+        if values.dtype.kind in "iu":
+            return values
+    return np.asarray(lst, dtype=np.int64)
+
+def input_stats(lst: Union[List[int], "np.ndarray"], sample_size: int = 1024) -> Dict[str, Any]:
+    """
+    Cheap statistics of an input list, for choosing the best strategy to process it. Exact statistics would take a full
+    pass over the list, which costs about as much as the algorithms themselves, so the smallest and greatest numbers are
+    estimated from an evenly spaced sample of the list. Numpy arrays and buffers (memoryview, array) are measured exactly
+    with numpy if it is installed. Checking whether a list is sorted stops at the first number which is out of order, so
+    it is only slow for sorted lists.
+
+    :param lst: list, numpy array or buffer of integers (such as the memoryview returned by binary_io.load_ints)
+    :param sample_size: number of evenly spaced numbers to estimate the smallest and greatest number from
+    :return: dict with 'length', 'is_array' (numpy array or buffer), 'is_sorted', 'min', 'max', 'value_width'
+        (max - min + 1, or 0 for an empty list) and 'exact' (whether min and max are exact or estimated)
+    """
+    length = len(lst)
+    is_array = isinstance(lst, (memoryview, array)) or backends.is_ndarray(lst)
+    if length == 0:
+        return {"length": 0, "is_array": is_array, "is_sorted": True, "min": None, "max": None, "value_width": 0, "exact": True}
+    if is_array and backends.has_numpy():
+        np = backends.numpy()
+        values = np.asarray(lst)
+        is_sorted = bool(np.all(values[:-1] <= values[1:]))
+        low, high, exact = int(values.min()), int(values.max()), True
+    else:
+        is_sorted = all(map(operator.le, lst, itertools.islice(lst, 1, None)))
+        if is_sorted:
+            low, high, exact = lst[0], lst[-1], True
+        else:
+            step = max(length // sample_size, 1)
+            sample = lst[::step]
+            low, high, exact = min(sample), max(sample), step == 1
+    return {"length": length, "is_array": is_array, "is_sorted": is_sorted, "min": low, "max": high,
+            "value_width": high - low + 1, "exact": exact}
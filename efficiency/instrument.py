@@ -0,0 +1,214 @@
+"""
+Per-phase instrumentation of the hot paths of lst_to_dict_fast and target_sum_fast (and any function using it).
+
+An instrumented function calls start() once per call, which returns None while instrumentation is disabled, so the
+only cost when disabled is that call and a check for None at the end of every phase. While enabled, start() returns a
+CallRecord, which records the wall time and element count of every phase (and the peak allocation of every phase,
+if enabled with allocations=True, using tracemalloc). Finished records are passed to the registered callbacks and added
+to running totals per function and phase, which prometheus_text() exports in the Prometheus text format.
+measure_memory() measures the allocations of a whole call instead, for the memory trials.
+
+Usage:
+    with instrument.capture() as records:
+        lst_to_dict_fast(lst, 5, 500)
+    print(instrument.format_record(records[0]))
+
+    instrument.enable(callback=print)
+    ...
+    print(instrument.prometheus_text())
+"""
+from typing import List, Dict, Callable, Tuple, Iterator
+from contextlib import contextmanager
+import time
+
+_enabled = False
+_allocations = False
+_started_tracemalloc = False
+_callbacks: List[Callable[["CallRecord"], None]] = []
+# (function, phase) -> [calls, seconds, elements, allocated bytes]
+_totals: Dict[Tuple[str, str], List[float]] = {}
+
+class CallRecord:
+    """
+    Phases of one call of an instrumented function. Every phase lasts from the end of the previous phase (or the start
+    of the call) to the call of phase() which names it.
+    """
+
+    __slots__ = ("function", "phases", "_last_time", "_last_memory")
+
+    def __init__(self, function: str) -> None:
+        self.function = function
+        # (phase, seconds, elements, peak allocated bytes or None)
+        self.phases: List[Tuple[str, float, int, int]] = []
+        self._last_memory = 0
+        if _allocations:
+            import tracemalloc
+            tracemalloc.reset_peak()
+            self._last_memory = tracemalloc.get_traced_memory()[0]
+        self._last_time = time.perf_counter()
+
+    def phase(self, name: str, elements: int = 0) -> None:
+        """
+        End the current phase.
+
+        :param name: name of the phase
+        :param elements: number of elements processed in the phase
+        """
+        now = time.perf_counter()
+        allocated = None
+        if _allocations:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = peak - self._last_memory
+            tracemalloc.reset_peak()
+            self._last_memory = current
+        self.phases.append((name, now - self._last_time, elements, allocated))
+        # the time spent recording is not counted in the next phase
+        self._last_time = time.perf_counter()
+
+    def finish(self) -> None:
+        """
+        End the call: add its phases to the totals and pass it to the callbacks.
+        """
+        for name, seconds, elements, allocated in self.phases:
+            totals = _totals.setdefault((self.function, name), [0, 0.0, 0, 0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += elements
+            totals[3] += allocated or 0
+        for callback in list(_callbacks):
+            callback(self)
+
+    @property
+    def seconds(self) -> float:
+        return sum(seconds for _, seconds, _, _ in self.phases)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.function!r}, {self.phases!r})"
+
+def start(function: str) -> CallRecord:
+    """
+    Called by instrumented functions at the start of every call.
+
+    :param function: name of the instrumented function
+    :return: record of the call, or None if instrumentation is disabled
+    """
+    if not _enabled:
+        return None
+    return CallRecord(function)
+
+def enable(callback: Callable[[CallRecord], None] = None, allocations: bool = False) -> None:
+    """
+    Enable instrumentation, or add a callback if it is already enabled.
+
+    :param callback: called with the record of every finished call
+    :param allocations: also record the peak allocation of every phase. Starts tracemalloc if it is not tracing yet,
+        which slows down all allocations while enabled.
+    """
+    global _enabled, _allocations, _started_tracemalloc
+    _enabled = True
+    if callback is not None:
+        _callbacks.append(callback)
+    if allocations and not _allocations:
+        import tracemalloc
+        _allocations = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+
+def disable() -> None:
+    """
+    Disable instrumentation and remove all callbacks. The totals are kept.
+    """
+    global _enabled, _allocations, _started_tracemalloc
+    _enabled = False
+    _allocations = False
+    _callbacks.clear()
+    if _started_tracemalloc:
+        import tracemalloc
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset() -> None:
+    """Clear the totals."""
+    _totals.clear()
+
+@contextmanager
+def capture(allocations: bool = False) -> Iterator[List[CallRecord]]:
+    """
+    Enable instrumentation within a with block, collecting the records of all calls finished within it.
+    Instrumentation is disabled again afterwards, unless it was enabled before.
+
+    :param allocations: also record the peak allocation of every phase
+    :return: list which receives the records
+    """
+    was_enabled = _enabled
+    records = []
+    enable(records.append, allocations)
+    try:
+        yield records
+    finally:
+        if was_enabled:
+            _callbacks.remove(records.append)
+        else:
+            disable()
+
+def measure_memory(func: Callable, *args) -> Tuple[object, int, int]:
+    """
+    Call func(*args) while tracing memory allocations with tracemalloc. Tracing slows the call down a lot, so this should
+    not be combined with timing the same call.
+
+    :param func: function to be called
+    :param args: arguments of the function
+    :return: result of the call, peak bytes allocated during the call and bytes still allocated after the call, which is the
+        size of the result (not counting objects shared with the input, like the integers of the list)
+    """
+    import tracemalloc
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    current, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+    return result, peak - baseline, current - baseline
+
+def format_record(record: CallRecord, indent: str = "    ") -> str:
+    """
+    :param record: record of a call
+    :param indent: prefix of every line
+    :return: one line per phase with its time, share of the call, element count and allocation if recorded
+    """
+    total = max(record.seconds, 1e-12)
+    lines = []
+    for name, seconds, elements, allocated in record.phases:
+        line = f"{indent}phase {name:<16} {seconds * 1000:10.3f}ms {seconds / total:7.1%} {elements:>12} elements"
+        if allocated is not None:
+            line += f" {allocated / 1_000_000:9.3f}MB peak"
+        lines.append(line)
+    return "\n".join(lines)
+
+def prometheus_text(prefix: str = "algorithm_phase") -> str:
+    """
+    Export the totals in the Prometheus text exposition format, as counters labeled with function and phase.
+
+    :param prefix: prefix of the metric names
+    :return: text with the metrics
+    """
+    metrics = [("calls_total", "Number of calls which went through the phase.", 0),
+               ("seconds_total", "Wall time spent in the phase.", 1),
+               ("elements_total", "Elements processed in the phase.", 2),
+               ("allocated_bytes_total", "Sum of the peak allocations of the phase, if recorded.", 3)]
+    lines = []
+    for suffix, description, position in metrics:
+        name = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for (function, phase), totals in sorted(_totals.items()):
+            lines.append(f'{name}{{function="{function}",phase="{phase}"}} {totals[position]}')
+    return "\n".join(lines) + "\n"
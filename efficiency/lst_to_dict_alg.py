@@ -0,0 +1,1001 @@
+from typing import List, Dict, Callable, Union, Tuple, Iterator, Any
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping
+import collections
+import functools
+import itertools
+import operator
+import os
+import random
+import time
+
+from efficiency import backends, instrument, parallel
+from efficiency.inputs import NUMPY_MIN_LENGTH, fits_int64, input_stats, numpy_values
+from efficiency.instrument import measure_memory
+
+def _integer_key(key: object) -> Union[int, None]:
+    # key of RangeIndex and BitsetIndex as an int, accepting numpy integers and other types with __index__ like the
+    # dicts they replace. None for keys which are not integers
+    try:
+        return operator.index(key)
+    except TypeError:
+        return None
+
+class RangeIndex(Mapping):
+    """
+    Read-only mapping returned by lst_to_dict_range, with the same keys and values as the dicts returned by
+    the lst_to_dict functions: all integers in the range [start, end] as keys, and their index in the list or
+    None as values. Instead of one dict entry per key, the indices are stored in a single array of 64 bit
+    integers, offset by start, with -1 marking numbers which are not in the list. Compares equal to a dict
+    with the same items, so it can be used in place of the dicts.
+    """
+
+    __slots__ = ("start", "end", "_positions")
+
+    def __init__(self, start: int, end: int, positions: array = None) -> None:
+        """
+        :param start: integer denoting start of range
+        :param end: integer denoting end of range
+        :param positions: array('q') of length end - start + 1 with the index of each number, or -1 if the number
+            is not in the list. Defaults to an array where no number is in the list.
+        """
+        width = max(end - start + 1, 0)
+        if positions is None:
+            positions = array("q", [-1]) * width
+        elif len(positions) != width:
+            raise ValueError(f"positions has length {len(positions)}, expected {width} for range [{start}, {end}]")
+        self.start = start
+        self.end = end
+        self._positions = positions
+
+    def __getitem__(self, key: int) -> Union[int, None]:
+        number = _integer_key(key)
+        if number is None or number < self.start or number > self.end:
+            raise KeyError(key)
+        index = self._positions[number - self.start]
+        return index if index >= 0 else None
+
+    def __contains__(self, key: object) -> bool:
+        number = _integer_key(key)
+        return number is not None and self.start <= number <= self.end
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.end + 1))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RangeIndex):
+            if len(self) == 0 or len(other) == 0:
+                return len(self) == len(other)
+            return self.start == other.start and self._positions == other._positions
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._positions.__sizeof__()
+
+    def sub_range(self, start: int, end: int) -> "RangeIndex":
+        """
+        Answer a query for a range within this one by copying a slice of the positions, without looking at the list.
+
+        :param start: integer denoting start of range, at least self.start unless the range is empty
+        :param end: integer denoting end of range, at most self.end unless the range is empty
+        :return: RangeIndex for the range [start, end]
+        """
+        if start > end:
+            return RangeIndex(start, end)
+        if start < self.start or end > self.end:
+            raise ValueError(f"Range [{start}, {end}] is not within [{self.start}, {self.end}]")
+        return RangeIndex(start, end, self._positions[start - self.start:end - self.start + 1])
+
+def lst_to_dict_slow(lst: List[int], start: int, end: int) -> Dict[int, Union[int, None]]:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end', 
+    create a dictionary whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    The proposed time complexity is O(n*n) = O(n^2).
+
+    :param lst: list of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: dict with numbers in range as keys and indices or None as values.
+    """
+    dict = {}
+    # loop over numbers in range 
+    for i in range(start,end + 1):
+        index = None
+        # loop over entire list to check if number in list
+        for j, value in enumerate(lst):
+            if value == i:
+                index = j
+                break
+        dict[i] = index
+    return dict
+
+def lst_to_dict_fast(lst: List[int], start: int, end: int) -> Dict[int, Union[int, None]]:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end', 
+    create a dictionary whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    The list is not modified: instead of sorting the numbers, the indices of the numbers within range are
+    sorted by the number they point to. If a number occurs more than once, its last index is used.
+    The proposed time complexity is O(n + klog(k) + len(range)), where k is the count of numbers within range.
+    Instrumented with the phases 'filter', 'sort' and 'sweep' (see instrument.py).
+
+    :param lst: list of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: dict with numbers in range as keys and indices or None as values.
+    """
+    recorder = instrument.start("lst_to_dict_fast")
+    result_dict = {}
+    # Collect indices of numbers within range - O(n)
+    in_range = [index for index, value in enumerate(lst) if start <= value <= end]
+    if recorder is not None:
+        recorder.phase("filter", len(lst))
+    # Sort indices by their number - O(klog(k)). The sort is stable, so indices
+    # of equal numbers stay in ascending order and the last one wins below.
+    in_range.sort(key=lst.__getitem__)
+    if recorder is not None:
+        recorder.phase("sort", len(in_range))
+    expected = start
+    # iterate over sorted indices - O(k + len(range))
+    for index in in_range:
+        value = lst[index]
+        # fill the 'gap' between the previous number and the current one with None.
+        # for example if previous number is 8 and current number is 12, fill 9 to 11.
+        # duplicates leave an empty gap, as expected is already past them.
+        for k in range(expected, value):
+            result_dict[k] = None
+        result_dict[value] = index
+        expected = value + 1
+    # fill the gap between the greatest number within range and end
+    for k in range(expected, end + 1):
+        result_dict[k] = None
+    if recorder is not None:
+        recorder.phase("sweep", len(in_range) + len(result_dict))
+        recorder.finish()
+    return result_dict
+
+def lst_to_dict_simple(lst: List[int], start: int, end: int) -> Dict[int, Union[int, None]]:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end', 
+    create a dictionary whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    The proposed time complexity is O(n).
+
+    :param lst: list of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: dict with numbers in range as keys and indices or None as values.
+    """
+    result_dict = {}
+    # loop over entire list and add numbers that are within range
+    # as dict keys and their index as corresponding values. O(n).
+    for index, value in enumerate(lst):
+        if value >= start and value <= end:
+            result_dict[value] = index
+    # loop over range and corresponding value of numbers to either the index
+    # or None if number is not to be found. O(len(range))
+    for i in range(start, end + 1):
+        result_dict[i] = result_dict.get(i)
+    return result_dict
+
+def lst_to_dict_numpy(lst: Union[List[int], "np.ndarray"], start: int, end: int,
+                      as_array: bool = False) -> Union[Dict[int, Union[int, None]], "np.ndarray"]:
+    """
+    Given an unsorted list (or numpy array) of integers, and two integers denoting a range - 'start' and 'end',
+    create a dictionary whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    Vectorized with numpy: the indices of the numbers within range are scattered into a dense array of
+    length end - start + 1, where -1 marks numbers which are not in the list. If a number occurs more than
+    once, its last index is used, like in lst_to_dict_simple.
+    Arrays and buffers are read in their own integer type (see inputs.numpy_values). A list is converted to 64 bit integers,
+    so a list with a number which does not fit into 64 bits is processed by lst_to_dict_simple (or lst_to_dict_range
+    if as_array is True) instead.
+    The proposed time complexity is O(n + len(range)), with the loops running in numpy instead of the interpreter.
+
+    :param lst: list or numpy array of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :param as_array: return the dense array instead of a dict, which skips the cost of building the dict
+    :return: dict with numbers in range as keys and indices or None as values, or dense array of indices with -1
+        for missing numbers if as_array is True.
+    """
+    np = backends.numpy()
+    if np is None:
+        raise ImportError("lst_to_dict_numpy requires numpy to be installed")
+    try:
+        values = numpy_values(lst)
+    except OverflowError:
+        if as_array:
+            return np.frombuffer(lst_to_dict_range(lst, start, end)._positions, dtype=np.int64)
+        return lst_to_dict_simple(lst, start, end)
+    width = max(end - start + 1, 0)
+    dense = np.full(width, -1, dtype=np.int64)
+    # the range may reach beyond the array's type, where none of its numbers can be. Comparing with the part of the
+    # range within the type keeps start and end from overflowing it.
+    limits = np.iinfo(values.dtype)
+    low, high = max(start, int(limits.min)), min(end, int(limits.max))
+    if low <= high:
+        # indices of the numbers within range, in ascending order - O(n)
+        in_range = np.flatnonzero((values >= low) & (values <= high))
+        # only the numbers within range are widened to 64 bits. Their offsets from low are smaller than the range,
+        # so computing them modulo 2^64 is exact for any integer type.
+        offsets = (values[in_range].astype(np.uint64) - np.uint64(low % 2 ** 64)).view(np.int64)
+        # scatter the indices to the position of their number. maximum.at is unbuffered, so when a number
+        # occurs more than once the greatest (last) index is kept - O(n)
+        np.maximum.at(dense, offsets + (low - start), in_range)
+    if as_array:
+        return dense
+    # the dict is built from a python list, which is much faster than iterating over the numpy array - O(len(range))
+    return {key: (index if index >= 0 else None) for key, index in zip(range(start, end + 1), dense.tolist())}
+
+def lst_to_dict_range(lst: List[int], start: int, end: int) -> RangeIndex:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end',
+    create a mapping whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    Same as lst_to_dict_simple, but the result is a RangeIndex backed by a single array instead of a dict,
+    which uses a fraction of the memory and does not allocate anything per key.
+    The proposed time complexity is O(n + len(range)).
+
+    :param lst: list of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: RangeIndex with numbers in range as keys and indices or None as values.
+    """
+    result = RangeIndex(start, end)
+    positions = result._positions
+    # loop over entire list and store the index of numbers within range at
+    # their offset from start. Later occurrences overwrite earlier ones. O(n).
+    for index, value in enumerate(lst):
+        if value >= start and value <= end:
+            positions[value - start] = index
+    return result
+
+class ValueIndex:
+    """
+    Value to index structure which is built once over a list and then answers lst_to_dict queries for many
+    different ranges, without scanning the list again for every query. The answers are the same as those of
+    lst_to_dict_simple, i.e. the last index of every number.
+
+    If the numbers in the list are dense (the range between the smallest and greatest number is at most
+    dense_factor times the length of the list), the index is a table with the last index of every number
+    in that range, and a query copies a slice of it - O(len(range)). The table is accompanied by the ascending
+    indices of every number which occurs more than once, so that updating the last occurrence of a number finds
+    the previous one without scanning the list. Otherwise the index is an array of
+    the numbers in sorted order with a parallel array of their original indices, and a query uses binary
+    search to find the numbers within range - O(log(n) + len(range)).
+
+    Appending and updating numbers modify the index in place instead of rebuilding it.
+    """
+
+    def __init__(self, lst: List[int], dense_factor: int = 4) -> None:
+        """
+        :param lst: list of unsorted integers. The numbers are copied, so later changes to the list are not seen.
+        :param dense_factor: use the table if the range of numbers is at most this many times the length of the list
+        """
+        self._values = array("q", lst)
+        self._dense_factor = dense_factor
+        self._build()
+
+    def _build(self) -> None:
+        values = self._values
+        low = min(values) if values else 0
+        high = max(values) if values else -1
+        if values and high - low + 1 <= self._dense_factor * len(values):
+            table = array("q", [-1]) * (high - low + 1)
+            duplicates = {}
+            # later occurrences overwrite earlier ones - O(n)
+            for index, value in enumerate(values):
+                previous = table[value - low]
+                if previous >= 0:
+                    duplicates.setdefault(value, [previous]).append(index)
+                table[value - low] = index
+            self._low = low
+            self._table = table
+            self._duplicates = duplicates
+            self._sorted_values = self._sorted_indices = None
+        else:
+            # stable sort, so equal numbers keep their indices in ascending order - O(nlog(n))
+            order = sorted(range(len(values)), key=values.__getitem__)
+            self._sorted_values = array("q", [values[index] for index in order])
+            self._sorted_indices = array("q", order)
+            self._table = self._duplicates = None
+
+    @property
+    def dense(self) -> bool:
+        """True if the index is currently a table, False if it is a sorted array."""
+        return self._table is not None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def query(self, start: int, end: int) -> RangeIndex:
+        """
+        Answer a lst_to_dict query for the given range.
+
+        :param start: integer denoting start of range
+        :param end: integer denoting end of range
+        :return: RangeIndex with numbers in range as keys and indices or None as values.
+        """
+        result = RangeIndex(start, end)
+        positions = result._positions
+        if self._table is not None:
+            table = self._table
+            low = max(start, self._low)
+            high = min(end, self._low + len(table) - 1)
+            if low <= high:
+                positions[low - start:high - start + 1] = table[low - self._low:high - self._low + 1]
+            return result
+        sorted_values = self._sorted_values
+        sorted_indices = self._sorted_indices
+        # numbers within range are a contiguous run of the sorted array. Equal numbers are ordered by
+        # index, so the last (greatest) index of each number is written last.
+        for k in range(bisect_left(sorted_values, start), bisect_right(sorted_values, end)):
+            positions[sorted_values[k] - start] = sorted_indices[k]
+        return result
+
+    def append(self, value: int) -> None:
+        """
+        Append a number to the end of the indexed list. O(1) for the table (unless it has to grow), O(n) memory
+        move for the sorted array.
+
+        :param value: number to append
+        """
+        index = len(self._values)
+        self._values.append(value)
+        if self._table is not None:
+            self._table_set(value, index)
+        else:
+            # the new index is the greatest, so it goes after all equal numbers
+            position = bisect_right(self._sorted_values, value)
+            self._sorted_values.insert(position, value)
+            self._sorted_indices.insert(position, index)
+
+    def update(self, index: int, value: int) -> None:
+        """
+        Replace the number at the given index of the indexed list.
+
+        :param index: index of the number in the list
+        :param value: new number
+        """
+        old_value = self._values[index]
+        if old_value == value:
+            return
+        self._values[index] = value
+        if self._table is not None:
+            indices = self._duplicates.get(old_value)
+            if indices is None:
+                # the updated index was the only occurrence of the old number
+                self._table[old_value - self._low] = -1
+            else:
+                # the last remaining occurrence is known without scanning the list - O(k) for k occurrences
+                del indices[bisect_left(indices, index)]
+                self._table[old_value - self._low] = indices[-1]
+                if len(indices) == 1:
+                    del self._duplicates[old_value]
+            self._table_set(value, index)
+            return
+        sorted_values = self._sorted_values
+        sorted_indices = self._sorted_indices
+        # equal numbers are ordered by index, so the pair can be found with binary search over both arrays
+        position = bisect_left(sorted_indices, index,
+                               bisect_left(sorted_values, old_value), bisect_right(sorted_values, old_value))
+        del sorted_values[position]
+        del sorted_indices[position]
+        position = bisect_left(sorted_indices, index,
+                               bisect_left(sorted_values, value), bisect_right(sorted_values, value))
+        sorted_values.insert(position, value)
+        sorted_indices.insert(position, index)
+
+    def _table_set(self, value: int, index: int) -> None:
+        table = self._table
+        table_high = self._low + len(table) - 1
+        if value < self._low or value > table_high:
+            low = min(value, self._low)
+            high = max(value, table_high)
+            if high - low + 1 > self._dense_factor * len(self._values):
+                # the numbers are no longer dense enough for a table, switch to the sorted array
+                self._build()
+                return
+            table = array("q", [-1]) * (self._low - low) + table + array("q", [-1]) * (high - table_high)
+            self._table = table
+            self._low = low
+        offset = value - self._low
+        previous = table[offset]
+        if previous >= 0:
+            # the number already occurs, keep all of its indices in case the last one is updated later
+            indices = self._duplicates.setdefault(value, [previous])
+            insort(indices, index)
+            table[offset] = indices[-1]
+        else:
+            table[offset] = index
+
+def _lst_to_dict_chunk(shared_name: str, chunk_start: int, chunk_end: int, start: int, end: int) -> Dict[int, int]:
+    # runs in a worker process: index the numbers within range of one chunk of the shared list
+    shared = parallel.attach_shared(shared_name)
+    try:
+        partial_dict = {}
+        with shared.buf.cast("q") as values, values[chunk_start:chunk_end] as chunk:
+            for offset, value in enumerate(chunk):
+                if value >= start and value <= end:
+                    partial_dict[value] = chunk_start + offset
+        return partial_dict
+    finally:
+        shared.close()
+
+def lst_to_dict_parallel(lst: List[int], start: int, end: int, workers: int = None,
+                         executor: "ProcessPoolExecutor" = None) -> Dict[int, Union[int, None]]:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end',
+    create a dictionary whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    Same result as lst_to_dict_simple, computed by multiple processes: the list is copied once into shared memory,
+    each worker indexes the numbers within range of one chunk of the list, and the partial dicts are merged in
+    chunk order, so that later indices overwrite earlier ones.
+    The proposed time complexity is O(n / workers + len(range)), plus the cost of starting the processes
+    and of sending back the partial dicts.
+
+    :param lst: list of unsorted integers, which must fit into 64 bits
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :param workers: number of chunks and worker processes, defaults to the number of CPUs
+    :param executor: process pool to run the chunks on, a new one is started (and shut down) if not given
+    :return: dict with numbers in range as keys and indices or None as values.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    shared = parallel.share_list(lst)
+    pool = executor if executor is not None else parallel.process_pool(workers)
+    try:
+        futures = [pool.submit(_lst_to_dict_chunk, shared.name, chunk_start, chunk_end, start, end)
+                   for chunk_start, chunk_end in parallel.chunk_bounds(len(lst), workers)]
+        result_dict = {}
+        # merge in chunk order, so the last index of duplicates wins - O(k)
+        for future in futures:
+            result_dict.update(future.result())
+    finally:
+        if executor is None:
+            pool.shutdown()
+        shared.close()
+        shared.unlink()
+    # loop over range and set numbers which are not to be found to None. O(len(range))
+    for i in range(start, end + 1):
+        result_dict[i] = result_dict.get(i)
+    return result_dict
+
+def lst_to_dict_sorted(lst: List[int], start: int, end: int) -> RangeIndex:
+    """
+    Given a list of integers sorted in ascending order, and two integers denoting a range - 'start' and 'end',
+    create a mapping whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    The numbers within range are found with binary search, so the rest of the list is never looked at.
+    Gives wrong results if the list is not sorted.
+    The proposed time complexity is O(log(n) + len(range)).
+
+    :param lst: list of integers sorted in ascending order
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: RangeIndex with numbers in range as keys and indices or None as values.
+    """
+    result = RangeIndex(start, end)
+    positions = result._positions
+    # equal numbers are next to each other, so the last index of each number is written last. int() keeps the
+    # items of numpy arrays from overflowing their integer type.
+    for index in range(bisect_left(lst, start), bisect_right(lst, end)):
+        positions[int(lst[index]) - start] = index
+    return result
+
+class BitsetIndex(Mapping):
+    """
+    Read-only mapping returned by lst_to_dict_bitset, with the same keys and values as RangeIndex. Membership of every
+    number in the range [start, end] is stored as one bit of a bitmap, and only the numbers which are in the list
+    have an index, stored in ascending order of the numbers in a compact array. The index of a number is found by
+    counting the set bits before its own bit (its rank), using the precomputed count of set bits before every block
+    of the bitmap. For a range which is sparsely filled, this takes a fraction of the memory of RangeIndex, whose
+    array has a 64 bit entry for every number in the range.
+    """
+
+    __slots__ = ("start", "end", "_bitmap", "_ranks", "_positions")
+
+    # bytes per block of the bitmap with a precomputed rank
+    BLOCK_BYTES = 64
+
+    def __init__(self, start: int, end: int, bitmap: bytes, positions: array) -> None:
+        """
+        :param start: integer denoting start of range
+        :param end: integer denoting end of range
+        :param bitmap: little-endian bitmap of at least end - start + 1 bits, where bit k is set if start + k is in the list
+        :param positions: array('q') with the index of every number whose bit is set, in ascending order of the numbers
+        """
+        block_bytes = self.BLOCK_BYTES
+        # count of set bits before every block - O(len(range) / 8). bin().count() rather than int.bit_count(),
+        # which needs Python 3.10
+        block_counts = (bin(int.from_bytes(bitmap[offset:offset + block_bytes], "little")).count("1")
+                        for offset in range(0, len(bitmap), block_bytes))
+        ranks = array("q", itertools.accumulate(block_counts, initial=0))
+        if ranks[-1] != len(positions):
+            raise ValueError(f"bitmap has {ranks[-1]} set bits, but there are {len(positions)} positions")
+        self.start = start
+        self.end = end
+        self._bitmap = bitmap
+        self._ranks = ranks
+        self._positions = positions
+
+    def __getitem__(self, key: int) -> Union[int, None]:
+        number = _integer_key(key)
+        if number is None or number < self.start or number > self.end:
+            raise KeyError(key)
+        offset = number - self.start
+        byte_offset = offset >> 3
+        byte = self._bitmap[byte_offset]
+        bit = 1 << (offset & 7)
+        if not byte & bit:
+            return None
+        block_offset = byte_offset - byte_offset % self.BLOCK_BYTES
+        rank = (self._ranks[block_offset // self.BLOCK_BYTES]
+                + bin(int.from_bytes(self._bitmap[block_offset:byte_offset], "little")).count("1")
+                + bin(byte & (bit - 1)).count("1"))
+        return self._positions[rank]
+
+    def __contains__(self, key: object) -> bool:
+        number = _integer_key(key)
+        return number is not None and self.start <= number <= self.end
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.end + 1))
+
+    def __len__(self) -> int:
+        return max(self.end - self.start + 1, 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __sizeof__(self) -> int:
+        return (object.__sizeof__(self) + self._bitmap.__sizeof__() + self._ranks.__sizeof__()
+                + self._positions.__sizeof__())
+
+def lst_to_dict_bitset(lst: List[int], start: int, end: int) -> BitsetIndex:
+    """
+    Given an unsorted list of integers, and two integers denoting a range - 'start' and 'end',
+    create a mapping whose keys are all the integers in the given range (inclusive) and whose values
+    are the indices of those numbers if the numbers are in the list, or None otherwise.
+    Same as lst_to_dict_simple, but without hashing: the indices of the numbers within range are sorted by their
+    number, and the result is a BitsetIndex, which takes one bit per number in the range plus one array entry per
+    number in the list. Apart from filtering the list, all loops run in C (sort, map, int parsing).
+    The proposed time complexity is O(n + klog(k) + len(range)), where k is the count of numbers within range.
+
+    :param lst: list of unsorted integers
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: BitsetIndex with numbers in range as keys and indices or None as values.
+    """
+    width = max(end - start + 1, 0)
+    # Collect indices of numbers within range - O(n)
+    in_range = [index for index, value in enumerate(lst) if start <= value <= end]
+    # Sort indices by their number - O(klog(k)). The sort is stable, so of equal numbers the last index is last.
+    in_range.sort(key=lst.__getitem__)
+    values = list(map(lst.__getitem__, in_range))
+    # keep only the last of equal numbers, i.e. numbers which differ from the next one - O(k)
+    is_last = list(map(operator.ne, values, itertools.islice(values, 1, None)))
+    is_last.append(True)
+    positions = array("q", itertools.compress(in_range, is_last))
+    # one ascii digit per number of the range, the digit of 'end' first, which is parsed as a binary number with bit k
+    # set for number start + k. Parsing a binary number runs in linear time - O(len(range))
+    digits = bytearray(b"0") * width
+    collections.deque(map(digits.__setitem__, map(end.__sub__, itertools.compress(values, is_last)), itertools.repeat(ord("1"))), maxlen=0)
+    bitmap = int(digits or b"0", 2).to_bytes((width + 7) // 8, "little")
+    return BitsetIndex(start, end, bitmap, positions)
+
+def _lst_to_dict_numpy_range(lst: Union[List[int], "np.ndarray"], start: int, end: int) -> RangeIndex:
+    # numpy scatter, with the dense array copied into a RangeIndex instead of building a dict
+    positions = array("q")
+    positions.frombytes(lst_to_dict_numpy(lst, start, end, as_array=True).tobytes())
+    return RangeIndex(start, end, positions)
+
+LST_TO_DICT_STRATEGIES = {
+    "sorted": lst_to_dict_sorted,
+    "numpy": _lst_to_dict_numpy_range,
+    "range": lst_to_dict_range,
+    "bitset": lst_to_dict_bitset,
+    "simple": lst_to_dict_simple,
+    "fast": lst_to_dict_fast,
+    "slow": lst_to_dict_slow,
+    "parallel": lst_to_dict_parallel,
+}
+
+def choose_lst_to_dict_strategy(stats: Dict[str, Any], start: int, end: int) -> str:
+    """
+    Choose the fastest lst_to_dict strategy for an input with the given statistics and range. Measured on random inputs:
+    - a sorted list only needs a binary search for the numbers within range ('sorted').
+    - numpy arrays and buffers, and long lists whose range is not much wider than the list, are fastest scattered with
+      numpy into a dense array ('numpy'). Buffers are read by numpy without copying, and converting a long list to a
+      numpy array costs less than the interpreter loop it replaces. Numpy holds 64 bit integers, so it is only chosen
+      if the (estimated) smallest and greatest number fit into 64 bits. Should a number outside of the sample not fit,
+      lst_to_dict_numpy falls back to the interpreter loop, which is cheaper than a full pass to find the bounds.
+    - otherwise the array backed RangeIndex ('range') wins: most of the cost of the other functions is creating a dict
+      entry for every number in a wide range, which RangeIndex does not do.
+
+    :param stats: statistics returned by inputs.input_stats
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :return: key of LST_TO_DICT_STRATEGIES
+    """
+    range_width = end - start + 1
+    if stats["length"] == 0 or range_width <= 0:
+        return "range"
+    if stats["is_sorted"]:
+        return "sorted"
+    if ((stats["is_array"] or (stats["length"] >= NUMPY_MIN_LENGTH and range_width <= 4 * stats["length"]))
+            and backends.has_numpy() and fits_int64(stats["min"], stats["max"])):
+        return "numpy"
+    return "range"
+
+def lst_to_dict(lst: Union[List[int], "np.ndarray"], start: int, end: int, strategy: str = None,
+                debug: Callable[[str, Dict[str, Any]], None] = None) -> Mapping:
+    """
+    Given a list of integers, and two integers denoting a range - 'start' and 'end', create a mapping whose keys are
+    all the integers in the given range (inclusive) and whose values are the indices of those numbers if the numbers
+    are in the list, or None otherwise. If a number occurs more than once, its last index is used.
+    Single entry point which takes cheap statistics of the input (see inputs.input_stats) and dispatches to the implementation
+    which is fastest for it (see choose_lst_to_dict_strategy). Depending on the implementation, the result is a dict or
+    a RangeIndex; both compare equal to the dict returned by lst_to_dict_simple.
+
+    :param lst: list, numpy array or buffer of integers (such as the memoryview returned by binary_io.load_ints)
+    :param start: integer denoting start of range
+    :param end: integer denoting end of range
+    :param strategy: key of LST_TO_DICT_STRATEGIES to use instead of choosing one. 'sorted' requires a sorted list.
+    :param debug: called with the chosen strategy and the input statistics before dispatching
+    :return: mapping with numbers in range as keys and indices or None as values.
+    """
+    if strategy is None:
+        stats = input_stats(lst)
+        strategy = choose_lst_to_dict_strategy(stats, start, end)
+    elif strategy not in LST_TO_DICT_STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {sorted(LST_TO_DICT_STRATEGIES)}")
+    else:
+        stats = None
+    if debug is not None:
+        debug(strategy, stats if stats is not None else input_stats(lst))
+    if strategy not in ("numpy", "sorted") and backends.is_ndarray(lst):
+        # the other functions compute with the items, which would overflow the integer type of the array
+        lst = lst.tolist()
+    return LST_TO_DICT_STRATEGIES[strategy](lst, start, end)
+
+def single_io_test(func: Callable[[List[int], int, int], Dict], test_lst: List[int], 
+                    start: int, end: int, expected_result: Dict[int, Union[int, None]]) -> bool:
+    """
+    Function to test the correctness of lst_to_dict_slow and lst_to_dict_fast (or function with same signature and different implementation). Tests a few
+    trial inputs against expected output. Takes a function as argument and return True if results is correct, False otherwise.
+
+    :param func: lst_to_dict_slow or lst_to_dict_fast (or function with same signature and different implementation)
+    :return: True if correct, False otherwise
+    """
+    result_dict = func(test_lst, start, end)
+    if result_dict == expected_result:
+        return True
+    else:
+        print(f"Function {func.__name__} is incorrect.")
+        print(f"Tested input: {test_lst}")
+        print(f"Expected output: {expected_result}")
+        print(f"Actual output: {result_dict}")
+        return False
+
+def multiple_io_tests(func: Callable[[List[int], int, int], Dict]) -> Tuple[int]:
+    """
+    Helper functions to run multiple io tests. Takes as argument the lst_to_dict function to be tested and returns a tuple
+    whose first element is the number of passed tests and second element the number of failed tests.
+
+    :param func: lst_to_dict_slow or lst_to_dict_fast (or function with same signature and different implementation)
+    :return: Tuple with count of succesful and failed tests.
+    """
+    success_count = 0
+    fail_count = 0
+
+    test_lst_1 = [2, 1, 10, 0, 4, 3, 11]
+    start_1 = 3
+    end_1 = 10
+    expected_result_1 = {
+        3: 5,
+        4: 4,
+        5: None,
+        6: None,
+        7: None,
+        8: None,
+        9: None,
+        10: 2
+    }
+    result = single_io_test(func, test_lst_1, start_1, end_1, expected_result_1)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+    
+    test_lst_2 = [0, 15, 16, 18, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 32, 35, 36, 38, 39]
+    start_2 = 5
+    end_2 = 40
+    expected_result_2 = {
+        5: None, 6: None, 7: None, 8: None, 9: None, 10: None, 11: None, 12: None, 13: None, 14: None, 15: 1, 16: 2, 17: None, 
+        18: 3, 19: 4, 20: 5, 21: 6, 22: 7, 23: 8, 24: 9, 25: 10, 26: None, 27: 11, 28: 12, 29: 13, 30: 14, 31: None, 32: 15, 
+        33: None, 34: None, 35: 16, 36: 17, 37: None, 38: 18, 39: 19, 40: None
+    }
+    result = single_io_test(func, test_lst_2, start_2, end_2, expected_result_2)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+
+    test_lst_3 = [2, 4, 5, 6, 7, 8, 16, 19, 20, 21, 22, 24, 25, 29, 30, 31, 32, 33, 35, 37]
+    start_3 = 5
+    end_3 = 40
+    expected_result_3 = {
+        5: 2, 6: 3, 7: 4, 8: 5, 9: None, 10: None, 11: None, 12: None, 13: None, 14: None, 15: None, 16: 6, 17: None, 18: None, 19: 7,
+        20: 8, 21: 9, 22: 10, 23: None, 24: 11, 25: 12, 26: None, 27: None, 28: None, 29: 13, 30: 14, 31: 15, 32: 16, 33: 17, 34: None, 
+        35: 18, 36: None, 37: 19, 38: None, 39: None, 40: None}
+    result = single_io_test(func, test_lst_3, start_3, end_3, expected_result_3)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+
+    # numbers exactly at start and end of range
+    test_lst_4 = [9, 12, 5, 7, 3]
+    start_4 = 5
+    end_4 = 9
+    expected_result_4 = {5: 2, 6: None, 7: 3, 8: None, 9: 0}
+    result = single_io_test(func, test_lst_4, start_4, end_4, expected_result_4)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+
+    # single number list, range of a single number
+    test_lst_5 = [5]
+    start_5 = 5
+    end_5 = 5
+    expected_result_5 = {5: 0}
+    result = single_io_test(func, test_lst_5, start_5, end_5, expected_result_5)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+
+    print(f"IO test results for {func.__name__}: {success_count} successful and {fail_count} failed.")
+    return success_count, fail_count
+
+
+
+def comparative_tests(func_1: Callable[[List[int], int, int], Dict], func_2: Callable[[List[int], int, int], Dict], reps: int = 10,
+                      duplicates: bool = False) -> Tuple[int]:
+    """
+    Test two lst_to_dict functions by calling them with the same (random) input and comparing whether the outputs are equal.
+    Returns a tuple where the first int is the number of equal results and the second int is the number of different results.
+
+    :param func_1: first list_to_dict function for testing
+    :param func_2: second list_to_dict function for testing
+    :param reps: number of tests to be performed, defaults to 10
+    :param duplicates: test with shuffled lists in which numbers can repeat, instead of lists of distinct numbers
+    :return: Tuple with counts of equal results and different results
+    """
+    # variables for easy modification 
+    list_len = 20
+    max_num = 20
+    start = 5
+    end = 40
+
+    equal_count = 0
+    diff_count = 0
+    for _ in range(reps):
+        if duplicates:
+            test_lst = [random.randrange(start, end + 1) for _ in range(list_len)]
+        else:
+            unique_nums = set()
+            while len(unique_nums) < list_len:
+                rand_number = random.randrange(max_num)
+                unique_nums.add(rand_number)
+            test_lst = list(unique_nums)
+        result_1 = func_1(test_lst, start, end)
+        result_2 = func_2(test_lst, start, end)
+        if result_1 == result_2:
+            equal_count += 1
+        else:
+            print(f"Functions obtained different results.")
+            print(f"Input data: list = {test_lst}, start = {start}, end = {end}")
+            print(f"Output of {func_1.__name__}: ")
+            print(result_1)
+            print(f"Output of {func_2.__name__}:")
+            print(result_2)
+            diff_count += 1
+    print(f"Random comparative test results: out of {reps} trials, {equal_count} equal results and {diff_count} different results were obtained.")
+    return equal_count, diff_count
+
+def random_test_list(input_len: int, range_top: int = None) -> List[int]:
+    """
+    Generate the input list used by single_speed_trial and single_memory_trial: random distinct integers in the range [0, range_top).
+
+    :param input_len: desired length of input list, one more number is generated.
+    :param range_top: the greatest number that could be randomly generated, defaults to 10 times the input length
+    :return: list of random distinct integers
+    """
+    if range_top is None:
+        range_top = input_len * 10
+    unique_nums = set()
+    while len(unique_nums) <= input_len:
+        rand_number = random.randrange(range_top)
+        unique_nums.add(rand_number)
+    return list(unique_nums)
+
+def single_memory_trial(input_len: int, func: Callable[[List[int], int, int], Dict], range_top: int = None) -> Tuple[int, int]:
+    """
+    Function to test memory use of lst_to_dict functions, with the same input as single_speed_trial. Measures the peak memory
+    allocated during the call and the size of the returned object.
+
+    :param input_len: desired length of input list for testing.
+    :param func: lst_to_dict function to be tested.
+    :param range_top: the greatest number that could be randomly generated
+    :return: peak allocation and result size in bytes
+    """
+    test_lst = random_test_list(input_len, range_top)
+    start = 5
+    end = input_len // 2
+    _, peak, result_size = measure_memory(func, test_lst, start, end)
+    print(f"For function {func.__name__}, peak allocation for input length {input_len} was {peak / 1_000_000:.3f}MB "
+          f"and the result takes {result_size / 1_000_000:.3f}MB")
+    return peak, result_size
+
+def single_speed_trial(input_len: int, func: Callable[[List[int], int, int], Dict], range_top: int = None) -> float:
+    """
+    Function to test speed of lst_to_dict functions. Generates a list of random distinct integers of the desired input length in the 
+    desired range and measures time taken in milliseconds. If trial_count is changed to an int greater than 1, multiple trials are 
+    performed and the average time is returned. For repeated measurements with warmup and statistics, use benchmark.py.
+    For instrumented functions (see instrument.py), the time taken by each phase is printed too.
+
+    :param input_len: desired length of input list for testing.
+    :param func: lst_to_dict function to be tested.
+    :param range_top: the greatest number that could be randomly generated 
+    :return: time in milliseconds
+    """
+    test_lst = random_test_list(input_len, range_top)
+    start = 5
+    end = input_len // 2
+    with instrument.capture() as records:
+        start_time = time.perf_counter_ns() / 1_000_000
+        _ = func(test_lst, start, end)
+        end_time = time.perf_counter_ns() / 1_000_000
+    elapsed_time = end_time - start_time
+    print(f"For function {func.__name__}, time taken for input length {input_len} was {elapsed_time:.3f}ms")
+    for record in records:
+        print(instrument.format_record(record))
+    return elapsed_time
+
+def multiple_speed_trials(input_len: int, func: Callable[[List[int], int, int], Dict], trial_count: int, range_top: int = None,
+                          memory: bool = False) -> float:
+    """
+    Helper function which runs multiple speed trials and returns the average time.
+
+    :param input_len: desired length of input list for testing.
+    :param func: lst_to_dict function to be tested.
+    :param range_top: the greatest number that could be randomly generated 
+    :param trial_count: number of times the experiment is repeated.
+    :param memory: also run a memory trial after every speed trial, and print the average peak allocation and result size
+    :return: average time in milliseconds
+    """
+    time_results = []
+    memory_results = []
+    for _ in range(trial_count):
+        result = single_speed_trial(input_len, func, range_top)
+        time_results.append(result)
+        if memory:
+            memory_results.append(single_memory_trial(input_len, func, range_top))
+    average_time = sum(time_results) / len(time_results)
+    print(f"For function {func.__name__}, average time taken for input length {input_len} over {trial_count} trials was {average_time:.3f}ms")
+    if memory:
+        average_peak = sum(peak for peak, _ in memory_results) / len(memory_results)
+        average_size = sum(size for _, size in memory_results) / len(memory_results)
+        print(f"For function {func.__name__}, average peak allocation for input length {input_len} over {trial_count} trials was "
+              f"{average_peak / 1_000_000:.3f}MB and the result takes {average_size / 1_000_000:.3f}MB")
+    return average_time
+
+def index_reuse_trials(input_len: int, query_count: int, range_top: int = None, query_width: int = None) -> Dict[str, float]:
+    """
+    Function to compare answering many queries over the same list with the lst_to_dict functions, which scan the whole
+    list for every query, against building a ValueIndex once and querying it. Generates a list of random distinct
+    integers like single_speed_trial and random ranges of the same width, and measures total time taken in milliseconds.
+
+    :param input_len: desired length of input list for testing.
+    :param query_count: number of (start, end) queries over the same list.
+    :param range_top: the greatest number that could be randomly generated
+    :param query_width: number of integers in each queried range, defaults to 1% of input length
+    :return: dict with function names as keys and total time in milliseconds as values
+    """
+    if range_top is None:
+        range_top = input_len * 10
+    if query_width is None:
+        query_width = max(input_len // 100, 1)
+    test_lst = random_test_list(input_len, range_top)
+    random.shuffle(test_lst)
+    queries = []
+    for _ in range(query_count):
+        start = random.randrange(range_top)
+        queries.append((start, start + query_width - 1))
+
+    results = {}
+    for func in (lst_to_dict_fast, lst_to_dict_simple, lst_to_dict_range):
+        elapsed_ns = 0
+        for start, end in queries:
+            start_time = time.perf_counter_ns()
+            _ = func(test_lst, start, end)
+            elapsed_ns += time.perf_counter_ns() - start_time
+        results[func.__name__] = elapsed_ns / 1_000_000
+        print(f"For function {func.__name__}, time taken for {query_count} queries over input length {input_len} was {results[func.__name__]:.3f}ms")
+
+    start_time = time.perf_counter_ns()
+    value_index = ValueIndex(test_lst)
+    build_time = time.perf_counter_ns() - start_time
+    for start, end in queries:
+        _ = value_index.query(start, end)
+    elapsed_ns = time.perf_counter_ns() - start_time
+    results[ValueIndex.__name__] = elapsed_ns / 1_000_000
+    print(f"For {ValueIndex.__name__}, time taken for {query_count} queries over input length {input_len} was {results[ValueIndex.__name__]:.3f}ms, "
+          f"of which {build_time / 1_000_000:.3f}ms building the index")
+    return results
+
+def parallel_scaling_trials(input_len: int, worker_counts: List[int] = None, range_top: int = None) -> Dict[int, float]:
+    """
+    Function to measure how lst_to_dict_parallel scales with the number of worker processes. Generates a list of random distinct
+    integers like single_speed_trial, and measures time taken in milliseconds for each worker count, next to lst_to_dict_simple
+    on a single core (see parallel.scaling_trials).
+
+    :param input_len: desired length of input list for testing.
+    :param worker_counts: numbers of worker processes to try, defaults to powers of two up to the number of CPUs.
+    :param range_top: the greatest number that could be randomly generated
+    :return: dict with worker counts as keys and time in milliseconds as values
+    """
+    test_lst = random_test_list(input_len, range_top)
+    random.shuffle(test_lst)
+    start = 5
+    end = input_len // 2
+    return parallel.scaling_trials(lst_to_dict_simple, lst_to_dict_parallel, test_lst, (start, end), worker_counts)
+
+def run_tests(io_correctness: bool = True, comparative_correctness: bool = True, speed: bool = True, input_length: int = 1_000_000,
+              memory: bool = False, slow: bool = False) -> None:
+    if io_correctness:
+        _ = multiple_io_tests(lst_to_dict_slow)
+        _ = multiple_io_tests(lst_to_dict_fast)
+        _ = multiple_io_tests(lst_to_dict_simple)
+        _ = multiple_io_tests(lst_to_dict_range)
+        _ = multiple_io_tests(lst_to_dict_bitset)
+        _ = multiple_io_tests(lst_to_dict)
+        if backends.has_numpy():
+            _ = multiple_io_tests(lst_to_dict_numpy)
+    if comparative_correctness:
+        _ = comparative_tests(lst_to_dict_slow, lst_to_dict_fast)
+        _ = comparative_tests(lst_to_dict_simple, lst_to_dict_slow)
+        _ = comparative_tests(lst_to_dict_simple, lst_to_dict_range)
+        _ = comparative_tests(lst_to_dict_simple, lst_to_dict_bitset, duplicates=True)
+        _ = comparative_tests(lst_to_dict_simple, lst_to_dict_fast, duplicates=True)
+        _ = comparative_tests(lst_to_dict_simple, lst_to_dict, duplicates=True)
+        if backends.has_numpy():
+            _ = comparative_tests(lst_to_dict_simple, lst_to_dict_numpy)
+    if speed:
+        # lst_to_dict_slow is quadratic, only timed on request
+        speed_funcs = [lst_to_dict_slow] if slow else []
+        speed_funcs += [lst_to_dict_fast, lst_to_dict_simple, lst_to_dict_range, lst_to_dict_bitset, lst_to_dict]
+        if backends.has_numpy():
+            lst_to_dict_numpy_array = functools.partial(lst_to_dict_numpy, as_array=True)
+            lst_to_dict_numpy_array.__name__ = "lst_to_dict_numpy(as_array=True)"
+            speed_funcs += [lst_to_dict_numpy, lst_to_dict_numpy_array]
+        for func in speed_funcs:
+            _ = single_speed_trial(input_length, func)
+            if memory:
+                _ = single_memory_trial(input_length, func)
+        _ = index_reuse_trials(input_length, 20)
+        _ = parallel_scaling_trials(input_length)
+
@@ -0,0 +1,117 @@
+"""
+Shared memory and process pool helpers of the parallel engines (lst_to_dict_parallel, target_sum_parallel), and the
+trials measuring how they scale with the number of worker processes. multiprocessing takes a large part of the import
+time of the package, so it is only imported by these functions, once a parallel engine runs.
+"""
+from typing import List, Dict, Callable, Tuple
+from array import array
+import os
+import sys
+import time
+
+def create_shared(length: int) -> "shared_memory.SharedMemory":
+    """
+    Create a block of shared memory for the given number of 64 bit integers. The caller owns the block and has to close
+    and unlink it.
+
+    :param length: number of integers
+    :return: shared memory block
+    """
+    from multiprocessing import shared_memory
+    return shared_memory.SharedMemory(create=True, size=max(length, 1) * 8)
+
+def share_list(lst: List[int]) -> "shared_memory.SharedMemory":
+    """
+    Copy a list of integers into a block of shared memory as 64 bit integers, so that worker processes can read
+    it by attaching to the block by name instead of receiving a pickled copy. The caller owns the block and has to
+    close and unlink it.
+
+    :param lst: list or buffer of integers, which must fit into 64 bits
+    :return: shared memory block holding the integers
+    """
+    shared = create_shared(len(lst))
+    # buffers of 64 bit integers (like binary_io.load_ints) are copied as they are, anything else is converted first
+    source = lst if isinstance(lst, (memoryview, array)) and memoryview(lst).format == "q" else array("q", lst)
+    with shared.buf.cast("q") as values:
+        values[:len(lst)] = source
+    return shared
+
+def attach_shared(name: str) -> "shared_memory.SharedMemory":
+    """
+    Attach to a shared memory block created by share_list, from a worker process. Before python 3.13, attaching
+    registers the block with the resource tracker, and a worker which was started before the block was created has its
+    own tracker, which would warn about a leak and try to unlink the block again when the worker exits. Only the owner
+    of the block should unlink it, so the block is attached without registering it.
+
+    :param name: name of the shared memory block
+    :return: shared memory block, which the caller has to close
+    """
+    from multiprocessing import resource_tracker, shared_memory
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+def chunk_bounds(length: int, chunk_count: int) -> List[Tuple[int, int]]:
+    """
+    Split the indices of a list of the given length into at most chunk_count contiguous chunks of almost equal size.
+
+    :param length: length of the list
+    :param chunk_count: desired number of chunks
+    :return: list of (first index, index after last) tuples in ascending order
+    """
+    chunk_count = max(min(chunk_count, length), 1)
+    bounds = []
+    for k in range(chunk_count):
+        bounds.append((length * k // chunk_count, length * (k + 1) // chunk_count))
+    return bounds
+
+def process_pool(workers: int, started: bool = False) -> "ProcessPoolExecutor":
+    """
+    :param workers: number of worker processes
+    :param started: start the worker processes before returning, so that timing the first calls does not include
+        starting them. Otherwise they are started by the first calls.
+    :return: new process pool, which the caller has to shut down
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=workers)
+    if started:
+        _ = list(pool.map(abs, range(workers)))
+    return pool
+
+def scaling_trials(serial_func: Callable, parallel_func: Callable, lst: List[int], args: tuple,
+                   worker_counts: List[int] = None) -> Dict[int, float]:
+    """
+    Function to measure how a parallel engine scales with the number of worker processes. Measures time taken in
+    milliseconds for each worker count, next to the serial function on a single core. The process pool is started before
+    the timer, so only the work itself is measured.
+
+    :param serial_func: serial function, called as serial_func(lst, *args)
+    :param parallel_func: parallel engine, called as parallel_func(lst, *args, workers, executor)
+    :param lst: input list
+    :param args: arguments after the list, (start, end) or (target,)
+    :param worker_counts: numbers of worker processes to try, defaults to powers of two up to the number of CPUs.
+    :return: dict with worker counts as keys and time in milliseconds as values
+    """
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [2 ** k for k in range(cpu_count.bit_length()) if 2 ** k <= cpu_count]
+
+    start_time = time.perf_counter_ns() / 1_000_000
+    _ = serial_func(lst, *args)
+    serial_time = time.perf_counter_ns() / 1_000_000 - start_time
+    print(f"For function {serial_func.__name__}, time taken for input length {len(lst)} was {serial_time:.3f}ms")
+    results = {}
+    for workers in worker_counts:
+        with process_pool(workers, started=True) as executor:
+            start_time = time.perf_counter_ns() / 1_000_000
+            _ = parallel_func(lst, *args, workers, executor)
+            results[workers] = time.perf_counter_ns() / 1_000_000 - start_time
+        speedup = results[worker_counts[0]] / max(results[workers], 1e-6)
+        print(f"For function {parallel_func.__name__}, time taken for input length {len(lst)} with {workers} workers "
+              f"was {results[workers]:.3f}ms, {speedup:.2f}x the speed of {worker_counts[0]} worker(s)")
+    return results
@@ -0,0 +1,201 @@
+"""
+Asyncio front end for the lst_to_dict and target_sum functions.
+
+The functions run for hundreds of milliseconds on lists of a million numbers, which would block the event loop, so
+AlgorithmService runs them on an executor (a single thread by default, or any executor such as a process pool) and
+returns awaitables. A single dispatcher task takes requests off a queue in micro-batches, waiting up to batch_window
+seconds after the first request of a batch for more requests to arrive, and groups them by list (by identity, i.e.
+the same list object). Each group is answered with a single executor call, so the list is indexed once per batch
+instead of once per request: lst_to_dict requests are answered from one lst_to_dict_alg.ValueIndex, target_sum requests
+with one target_sum.target_sum_many call. At most max_in_flight calls run at a time; while they do, new requests wait
+in the queue, so the next batches get larger as the load grows. The queue is bounded: when it is full, callers wait
+until there is room again, which keeps a burst of requests from piling up unbounded work.
+
+The functions hold the GIL, so more than one thread only makes them compete with each other and with the event loop;
+a process pool with max_in_flight set to its number of workers runs them in parallel.
+
+Usage:
+    async with AlgorithmService() as service:
+        mapping = await service.lst_to_dict(lst, 5, 500)
+        pair = await service.target_sum(lst, 42)
+"""
+from typing import List, Dict, Union, Tuple, Any
+from collections.abc import Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+
+from efficiency import lst_to_dict_alg, target_sum
+
+LST_TO_DICT = "lst_to_dict"
+TARGET_SUM = "target_sum"
+
+# a batch of lst_to_dict ranges is answered from a single query for the range covering all of them, if it is at most
+# this many times as wide as the list or the ranges together
+UNION_MAX_FACTOR = 4
+
+# otherwise, this many ranges are worth building a ValueIndex for, fewer are answered one by one
+VALUE_INDEX_MIN_QUERIES = 16
+
+def _lst_to_dict_batch(lst: List[int], ranges: List[Tuple[int, int]]) -> List[Mapping]:
+    # runs on the executor: answer every range of one list, scanning or indexing the list once if possible
+    non_empty = [(start, end) for start, end in ranges if start <= end]
+    if len(non_empty) > 1:
+        low = min(start for start, _ in non_empty)
+        high = max(end for _, end in non_empty)
+        total_width = sum(end - start + 1 for start, end in non_empty)
+        if high - low + 1 <= UNION_MAX_FACTOR * max(len(lst), total_width):
+            union = lst_to_dict_alg.lst_to_dict(lst, low, high)
+            if isinstance(union, lst_to_dict_alg.RangeIndex):
+                return [union.sub_range(start, end) for start, end in ranges]
+        if len(non_empty) >= VALUE_INDEX_MIN_QUERIES:
+            try:
+                index = lst_to_dict_alg.ValueIndex(lst)
+            except OverflowError:
+                # ValueIndex stores the numbers as 64 bit integers, lst_to_dict takes numbers of any size
+                pass
+            else:
+                return [index.query(start, end) for start, end in ranges]
+    return [lst_to_dict_alg.lst_to_dict(lst, start, end) for start, end in ranges]
+
+def _target_sum_batch(lst: List[int], targets: List[int]) -> List[Tuple[int]]:
+    # runs on the executor: answer every target of one list, indexing the list once if there is more than one target
+    if len(targets) == 1:
+        return [target_sum.target_sum(lst, targets[0])]
+    return target_sum.target_sum_many(lst, targets)
+
+BATCH_FUNCTIONS = {LST_TO_DICT: _lst_to_dict_batch, TARGET_SUM: _target_sum_batch}
+
+class AlgorithmService:
+    """
+    Async API for lst_to_dict and target_sum, with requests against the same list coalesced into micro-batches and
+    backpressure from a bounded queue. Must be started (start() or 'async with') inside a running event loop.
+    """
+
+    def __init__(self, executor: Executor = None, max_queue: int = 1024, batch_window: float = 0.002,
+                 max_batch: int = 256, max_in_flight: int = 1) -> None:
+        """
+        :param executor: executor running the functions, defaults to a single thread owned by the service. With a process
+            pool, every batch sends its list to a worker process.
+        :param max_queue: greatest number of queued requests, before callers have to wait for room
+        :param batch_window: seconds to wait for more requests after the first request of a batch
+        :param max_batch: greatest number of requests in a batch
+        :param max_in_flight: greatest number of executor calls running at a time
+        """
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_in_flight = max_in_flight
+        self._slots = None
+        self._max_queue = max_queue
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self._queue = None
+        self._dispatcher = None
+        self._running_batches = set()
+        self.batch_count = 0
+        self.request_count = 0
+
+    async def start(self) -> None:
+        if self._dispatcher is not None:
+            raise RuntimeError("AlgorithmService is already started")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._queue = asyncio.Queue(self._max_queue)
+        self._slots = asyncio.Semaphore(self._max_in_flight)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def close(self) -> None:
+        """
+        Wait until every queued request is answered, then stop the dispatcher, and the executor if the service owns it.
+        """
+        if self._dispatcher is None:
+            return
+        await self._queue.join()
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+        self._dispatcher = None
+        if self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self) -> "AlgorithmService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def lst_to_dict(self, lst: List[int], start: int, end: int) -> Mapping:
+        """
+        Same result as lst_to_dict_alg.lst_to_dict, computed on the executor.
+
+        :param lst: list of integers, which must not be modified until the result is returned
+        :param start: integer denoting start of range
+        :param end: integer denoting end of range
+        :return: mapping with numbers in range as keys and indices or None as values.
+        """
+        return await self._submit(LST_TO_DICT, lst, (start, end))
+
+    async def target_sum(self, lst: List[int], target: int) -> Tuple[int]:
+        """
+        Same result as target_sum.target_sum, computed on the executor.
+
+        :param lst: list of integers, which must not be modified until the result is returned
+        :param target: target number to which two numbers in the list should add up to
+        :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+        """
+        return await self._submit(TARGET_SUM, lst, target)
+
+    async def _submit(self, kind: str, lst: List[int], argument: Union[int, Tuple[int, int]]) -> Any:
+        if self._dispatcher is None:
+            raise RuntimeError("AlgorithmService is not started")
+        future = asyncio.get_running_loop().create_future()
+        # waits while the queue is full
+        await self._queue.put((kind, lst, argument, future))
+        return await future
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._batch_window
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # group by kind and list identity, keeping the order of requests within each group
+            groups: Dict[Tuple[str, int], List[Tuple[str, List[int], Any, asyncio.Future]]] = {}
+            for request in batch:
+                groups.setdefault((request[0], id(request[1])), []).append(request)
+            for requests in groups.values():
+                # wait for a free slot, while new requests collect in the queue for the next batch
+                await self._slots.acquire()
+                task = asyncio.create_task(self._run_batch(requests))
+                self._running_batches.add(task)
+                task.add_done_callback(self._running_batches.discard)
+
+    async def _run_batch(self, requests: List[Tuple[str, List[int], Any, asyncio.Future]]) -> None:
+        kind, lst = requests[0][0], requests[0][1]
+        arguments = [argument for _, _, argument, _ in requests]
+        self.batch_count += 1
+        self.request_count += len(requests)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self._executor, BATCH_FUNCTIONS[kind], lst, arguments)
+        except Exception as error:
+            for _, _, _, future in requests:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, _, _, future), result in zip(requests, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+            for _ in requests:
+                self._queue.task_done()
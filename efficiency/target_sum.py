@@ -0,0 +1,1080 @@
+from typing import List, Dict, Callable, Union, Tuple, Iterable, Iterator, IO, Any
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import combinations, compress, count, islice, repeat
+import operator
+import os
+import random
+import time
+
+from efficiency import backends, instrument, parallel
+from efficiency.inputs import NUMPY_MIN_LENGTH, fits_int64, input_stats, numpy_values
+from efficiency.instrument import measure_memory
+
+def target_sum_slow(lst: List[int], target: int) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices.
+    Returns the pair with the smallest first index, see target_sum_hash for the pair returned by the other engines.
+    Proposed time complexity: O(n^2).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    for i in range(len(lst)):
+        for j in range(i+1, len(lst)):
+            if lst[i] + lst[j] == target:
+                return i,j
+
+def target_sum_fast(lst: List[int], target: int) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices. 
+    Proposed time complexity: O(n).
+    Instrumented with the phases 'dict_build' and 'complement_scan' (see instrument.py).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    recorder = instrument.start("target_sum_fast")
+    lst_dict = {}
+    # Put all numbers in list and their indices into dict
+    for index, value in enumerate(lst):
+        lst_dict[value] = index
+    if recorder is not None:
+        recorder.phase("dict_build", len(lst))
+    mid = target // 2
+    # Loop over all numbers from 0 up to target / 2. The idea is to check the dict for all
+    # possible combinations of numbers which add up to target. For example if target is 7,
+    # we will check whether 0 and 7 are in the list on the first iteration, then 6 and 1 on the 
+    # second iteration, then 5 and 2 and so on.
+    for i in range(mid + 1):
+        small = i
+        big = target - i
+        small_index = lst_dict.get(small)
+        big_index = lst_dict.get(big)
+        if small_index is not None and big_index is not None:
+            if recorder is not None:
+                recorder.phase("complement_scan", i + 1)
+                recorder.finish()
+            if small_index > big_index:
+                return big_index, small_index
+            else:
+                return small_index, big_index
+    if recorder is not None:
+        recorder.phase("complement_scan", max(mid + 1, 0))
+        recorder.finish()
+
+def target_sum_hash(lst: List[int], target: int) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices.
+    Single pass over the list which stops as soon as a pair is found. Unlike target_sum_fast, the cost does not
+    depend on the size of the target, and negative numbers or numbers greater than the target are handled.
+    The returned pair is the first one completed while scanning the list, i.e. the pair with the smallest
+    second index, paired with the first occurrence of its complement. This is not always the pair returned by
+    target_sum_slow, which has the smallest first index: for [1, 3, 4, 6] and target 7, target_sum_slow returns
+    (0, 3) and target_sum_hash returns (1, 2). Both return a pair exactly when there is one, with the smaller index
+    first. The smallest first index can only be known once the whole list is indexed, which would rule out stopping
+    at the first pair, so the other engines (target_sum, target_sum_many, the sorted, bitset, numpy, stream and
+    parallel engines) return the pair of target_sum_hash instead.
+    Proposed time complexity: O(n).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    seen = {}
+    for index, value in enumerate(lst):
+        # the complement can only be in the dict if it occurred earlier in the list, so the
+        # index found in the dict is always the smaller one.
+        complement_index = seen.get(target - value)
+        if complement_index is not None:
+            return complement_index, index
+        # only store the first occurrence of each value, so duplicates are paired with the smallest index
+        if value not in seen:
+            seen[value] = index
+
+def target_sum_numpy(lst: Union[List[int], "np.ndarray"], target: int) -> Tuple[int]:
+    """
+    Given a list (or numpy array) of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices.
+    Vectorized with numpy: the list is sorted once, then the complements of all numbers are looked up at once
+    with a binary search. Returns the same pair as target_sum_hash.
+    Arrays and buffers are sorted in their own integer type (see inputs.numpy_values). A list is converted to
+    64 bit integers, so a list with a number which does not fit into 64 bits is processed by target_sum_hash instead.
+    The target itself may be any integer.
+    Proposed time complexity: O(nlog(n)), with the loops running in numpy instead of the interpreter.
+
+    :param lst: list or numpy array of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    np = backends.numpy()
+    if np is None:
+        raise ImportError("target_sum_numpy requires numpy to be installed")
+    sorted_list = _numpy_sort(lst)
+    if sorted_list is None:
+        return target_sum_hash(lst, target)
+    return _numpy_first_pair(*sorted_list, target)
+
+def _numpy_sort(lst: Union[List[int], "np.ndarray"]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    # the numbers as an array, the order which sorts them and the sorted array, or None if a number does not fit
+    # into 64 bits
+    np = backends.numpy()
+    try:
+        values = numpy_values(lst)
+    except OverflowError:
+        return None
+    # stable sort, so the leftmost of equal numbers in sorted order has the smallest original index - O(nlog(n))
+    order = np.argsort(values, kind="stable")
+    return values, order, values[order]
+
+def _numpy_first_pair(values: "np.ndarray", order: "np.ndarray", sorted_values: "np.ndarray", target: int) -> Tuple[int]:
+    np = backends.numpy()
+    length = values.size
+    if length < 2:
+        return None
+    # only numbers whose complement is between the smallest and the greatest number can be part of a pair. Their
+    # complements fit into the array's type, even if the target or the complements of other numbers don't.
+    low, high = int(sorted_values[0]), int(sorted_values[-1])
+    if not 2 * low <= target <= 2 * high:
+        # no pair can reach the target, and the bounds of the search below would not fit into the array's type
+        return None
+    first = int(np.searchsorted(sorted_values, max(target - high, low), "left"))
+    last = int(np.searchsorted(sorted_values, min(target - low, high), "right"))
+    if first >= last:
+        return None
+    # complements of the numbers in descending order are ascending, so the binary searches below walk the
+    # sorted array in order instead of jumping around it. They are computed modulo 2^64, which wraps around to
+    # the exact complement as it is known to fit into the array's type. Only the candidates are widened to 64 bits.
+    candidates = sorted_values[first:last][::-1]
+    complements = (np.uint64(target % 2 ** 64) - candidates.astype(np.uint64)).astype(sorted_values.dtype)
+    # original index of the number whose complement is at each position
+    owners = order[first:last][::-1]
+    # position of the first occurrence of each complement in the sorted array - O(nlog(n))
+    positions = np.minimum(np.searchsorted(sorted_values, complements), length - 1)
+    complement_indices = order[positions]
+    # a pair is valid if the complement is in the list and occurs before the number itself - O(n)
+    valid = (sorted_values[positions] == complements) & (complement_indices < owners)
+    if not valid.any():
+        return None
+    # the valid number with the smallest index is the second index of the first pair completed in a scan of the list
+    best = int(np.argmin(np.where(valid, owners, length)))
+    return int(complement_indices[best]), int(owners[best])
+
+def target_sum_many(lst: List[int], targets: Iterable[int], method: str = "auto", probe_length: int = None) -> List[Tuple[int]]:
+    """
+    Given a list of integers and many target numbers, find for each target whether there are two numbers in the list
+    which add up to it, and return their indices. The list is indexed once for all targets, instead of once per call.
+    Each answer is the same pair as target_sum_hash would return for that target.
+
+    Methods:
+    - 'hash': for each target scan the list and look up complements until the first pair is completed, like
+      target_sum_hash. The first occurrence of every number is indexed once, when the first scan reaches it, so later
+      targets only look up complements. Once the whole list is indexed, targets outside of twice the smallest and
+      greatest number are answered without a scan. Fast when pairs are found early in the list.
+    - 'numpy': sort the list once, then for each target look up all complements at once with a vectorized
+      binary search. Its cost does not depend on where the pair is, so it is about 10 times slower per target than
+      'hash' when pairs are found early, but several times faster for targets without a pair. If a number does not
+      fit into 64 bits, the list is scanned like 'hash' instead.
+    - 'auto': 'hash' without numpy or for lists shorter than NUMPY_MIN_LENGTH. Otherwise, scan the first
+      probe_length numbers with 'hash' and fall back to 'numpy' for the targets which are not answered by then. Most
+      targets which have a pair are answered early in the scan, while targets without a pair would otherwise scan the
+      whole list. Measured with 100000 and 1000000 numbers, this is as fast as 'hash' for random targets, and 3 to 6
+      times faster for targets without a pair.
+
+    Proposed time complexity: O(n + targets * n), with the per target scan stopping at the first pair.
+
+    :param lst: list of integers
+    :param targets: target numbers to which two numbers in the list should add up to
+    :param method: 'auto', 'hash' or 'numpy'
+    :param probe_length: number of list items scanned with 'hash' before falling back to 'numpy' in 'auto' mode,
+        defaults to 1/16 of the list length
+    :return: list with a two integer tuple of indices (smaller index first) or None for each target, in order of targets.
+    """
+    if method not in ("auto", "hash", "numpy"):
+        raise ValueError(f"Unknown method {method!r}, expected 'auto', 'hash' or 'numpy'")
+    if method == "numpy" and not backends.has_numpy():
+        raise ImportError("target_sum_many with method 'numpy' requires numpy to be installed")
+    # short lists are not worth importing numpy and converting to an array for, 'auto' scans them with 'hash'
+    use_numpy = method == "numpy" or (method == "auto" and len(lst) >= NUMPY_MIN_LENGTH and backends.has_numpy())
+    if probe_length is None:
+        probe_length = len(lst) // 16
+    if method == "numpy":
+        probe = 0
+    elif use_numpy:
+        probe = probe_length
+    else:
+        # without the numpy fallback, pairs completed after the probe would be missed, so the whole list is scanned
+        probe = len(lst)
+
+    # first occurrence of every number in lst[:indexed]. The index is shared by all targets and only grows as far as
+    # their scans reach, so each number is indexed once per batch, and not at all if every pair is found before it.
+    first_index = {}
+    indexed = 0
+
+    def scan(target: int) -> Tuple[int]:
+        nonlocal indexed
+        # numbers already indexed: the complement occurs before the number if its first index is smaller - O(indexed)
+        for index, value in enumerate(islice(lst, indexed)):
+            complement_index = first_index.get(target - value)
+            if complement_index is not None and complement_index < index:
+                return complement_index, index
+        # continue like target_sum_hash, indexing the numbers for the following targets - O(probe - indexed)
+        for index in range(indexed, probe):
+            value = lst[index]
+            complement_index = first_index.get(target - value)
+            if complement_index is not None:
+                indexed = index
+                return complement_index, index
+            if value not in first_index:
+                first_index[value] = index
+        indexed = probe
+        return None
+
+    # twice the smallest and greatest number, found once a scan has indexed the whole list (which costs more than
+    # finding them), so that targets no pair can add up to are answered without a scan
+    bounds = None
+    # the list is sorted with numpy when the first target is not answered by the scan, so numpy is not imported
+    # (and the list not sorted) if every target is
+    sorted_list = None
+
+    results = []
+    for target in targets:
+        if bounds is not None and not bounds[0] <= target <= bounds[1]:
+            results.append(None)
+            continue
+        pair = scan(target)
+        if pair is None and probe < len(lst):
+            if sorted_list is None:
+                sorted_list = _numpy_sort(lst)
+                if sorted_list is None:
+                    # a number does not fit into 64 bits, scan the whole list from now on
+                    probe = len(lst)
+                    pair = scan(target)
+            if sorted_list is not None:
+                pair = _numpy_first_pair(*sorted_list, target)
+        if bounds is None and indexed == len(lst) and first_index:
+            bounds = 2 * min(first_index), 2 * max(first_index)
+        results.append(pair)
+    return results
+
+def _shared_slice(values: memoryview, first: int, last: int) -> List[int]:
+    # copy part of a shared memory view into a list, releasing the slice so the block can be closed
+    with values[first:last] as part:
+        return part.tolist()
+
+def _target_sum_sort_chunk(shared_name: str, positions_name: str, chunk_start: int, chunk_end: int,
+                           sample_count: int) -> List[int]:
+    # runs in a worker process: sort one chunk of the shared list in place, and store the original index of every
+    # sorted number at the same position of the shared positions. The sort is stable, so equal numbers keep their
+    # indices in ascending order. Returns evenly spaced numbers of the sorted chunk, to split the numbers into ranges.
+    shared = parallel.attach_shared(shared_name)
+    positions = parallel.attach_shared(positions_name)
+    try:
+        with shared.buf.cast("q") as values, positions.buf.cast("q") as indices:
+            chunk = _shared_slice(values, chunk_start, chunk_end)
+            order = sorted(range(len(chunk)), key=chunk.__getitem__)
+            sorted_chunk = [chunk[offset] for offset in order]
+            values[chunk_start:chunk_end] = array("q", sorted_chunk)
+            indices[chunk_start:chunk_end] = array("q", [chunk_start + offset for offset in order])
+        return [sorted_chunk[len(chunk) * k // sample_count] for k in range(sample_count)] if chunk else []
+    finally:
+        shared.close()
+        positions.close()
+
+def _target_sum_range(shared_name: str, positions_name: str, bounds: List[Tuple[int, int]], low: int, high: int,
+                      target: int) -> Tuple[int]:
+    # runs in a worker process: find the first pair completed by a number in the range [low, high) (None for no
+    # bound), like target_sum_hash does. The numbers in range and their complements are found with binary search
+    # in every sorted chunk, so only those parts of the list are read.
+    shared = parallel.attach_shared(shared_name)
+    positions = parallel.attach_shared(positions_name)
+    try:
+        best = None
+        with shared.buf.cast("q") as values, positions.buf.cast("q") as indices:
+            # first index of every complement of the numbers in range, i.e. of the numbers in
+            # (target - high, target - low]. Chunks are in list order, so the first index found is the smallest.
+            first_index = {}
+            for chunk_start, chunk_end in bounds:
+                first = chunk_start if high is None else bisect_right(values, target - high, chunk_start, chunk_end)
+                last = chunk_end if low is None else bisect_right(values, target - low, chunk_start, chunk_end)
+                for value, index in zip(_shared_slice(values, first, last), _shared_slice(indices, first, last)):
+                    first_index.setdefault(value, index)
+            # a number completes a pair at every index after the first index of its complement, the first pair
+            # is the one with the smallest such index
+            for chunk_start, chunk_end in bounds:
+                first = chunk_start if low is None else bisect_left(values, low, chunk_start, chunk_end)
+                last = chunk_end if high is None else bisect_left(values, high, chunk_start, chunk_end)
+                for value, index in zip(_shared_slice(values, first, last), _shared_slice(indices, first, last)):
+                    complement_index = first_index.get(target - value)
+                    if complement_index is not None and complement_index < index and (best is None or index < best[1]):
+                        best = complement_index, index
+        return best
+    finally:
+        shared.close()
+        positions.close()
+
+def target_sum_parallel(lst: List[int], target: int, workers: int = None, executor: "ProcessPoolExecutor" = None) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices.
+    Same result as target_sum_hash, computed by multiple processes in two rounds over a copy of the list in shared
+    memory. First, each worker sorts one chunk of the list in place, keeping the original indices in a second block of
+    shared memory, and returns a few evenly spaced numbers of its chunk. Then the numbers are split into one range per
+    worker at those samples, and each worker finds the first pair completed by a number in its range, looking up the
+    numbers and their complements with binary search in every sorted chunk. Besides copying the list into shared memory,
+    the calling process only picks the ranges and the pair with the smallest second index. Unlike target_sum_hash, the
+    whole list is processed even if a pair is completed early.
+    Proposed time complexity: O(n / workers * log(n)) in the workers, plus O(workers^2 log(workers)) to split the ranges.
+
+    :param lst: list of integers, which must fit into 64 bits
+    :param target: target number to which two numbers in the list should add up to
+    :param workers: number of chunks and worker processes, defaults to the number of CPUs
+    :param executor: process pool to run the chunks on, a new one is started (and shut down) if not given
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    shared = parallel.share_list(lst)
+    positions = parallel.create_shared(len(lst))
+    pool = executor if executor is not None else parallel.process_pool(workers)
+    try:
+        bounds = parallel.chunk_bounds(len(lst), workers)
+        futures = [pool.submit(_target_sum_sort_chunk, shared.name, positions.name, chunk_start, chunk_end, workers)
+                   for chunk_start, chunk_end in bounds]
+        samples = sorted(sample for future in futures for sample in future.result())
+        # split the numbers into ranges with about the same count of numbers each - O(workers^2 log(workers))
+        splits = sorted(set(samples[len(samples) * k // workers] for k in range(1, workers) if samples))
+        ranges = zip([None] + splits, splits + [None])
+        futures = [pool.submit(_target_sum_range, shared.name, positions.name, bounds, low, high, target)
+                   for low, high in ranges]
+        pairs = [pair for pair in (future.result() for future in futures) if pair is not None]
+        return min(pairs, key=operator.itemgetter(1)) if pairs else None
+    finally:
+        if executor is None:
+            pool.shutdown()
+        for block in (shared, positions):
+            block.close()
+            block.unlink()
+
+def target_sum_stream(numbers: Iterable[int], target: int) -> Iterator[Tuple[int, int]]:
+    """
+    Streaming version of target_sum_hash: consume integers one by one from any iterable (for example read_ints
+    over a file or socket) and yield the first pair of indices whose numbers add up to the target as soon as it
+    is completed, then stop consuming. The input is never held in memory, only the first index of every
+    distinct number seen so far.
+    Proposed time complexity: O(n), memory O(distinct numbers).
+
+    :param numbers: iterable of integers, possibly unbounded
+    :param target: target number to which two numbers should add up to
+    :return: iterator yielding at most one two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    seen = {}
+    for index, value in enumerate(numbers):
+        complement_index = seen.get(target - value)
+        if complement_index is not None:
+            yield complement_index, index
+            return
+        if value not in seen:
+            seen[value] = index
+
+def target_sum_stream_all(numbers: Iterable[int], target: int) -> Iterator[Tuple[int, int]]:
+    """
+    Consume integers one by one from any iterable and lazily yield every pair of indices whose numbers add up to
+    the target, as soon as each pair is completed. Pairs are yielded in order of their second index, then of their
+    first index. All indices of every distinct number are kept, so memory grows with the number of consumed
+    integers whose complement could still appear.
+    Proposed time complexity: O(n + number of pairs).
+
+    :param numbers: iterable of integers, possibly unbounded
+    :param target: target number to which two numbers should add up to
+    :return: iterator of two integer tuples with indices of the numbers which sum to target. Smaller index first.
+    """
+    seen = {}
+    for index, value in enumerate(numbers):
+        for complement_index in seen.get(target - value, ()):
+            yield complement_index, index
+        indices = seen.get(value)
+        if indices is None:
+            seen[value] = [index]
+        else:
+            indices.append(index)
+
+def target_sum_all(lst: List[int], target: int) -> Iterator[Tuple[int, int]]:
+    """
+    Given a list of integers and a target number, lazily yield every pair of indices whose numbers add up to the
+    target, in order of the second index, then of the first index. The dict from numbers to their indices is built
+    while scanning, so a caller which stops early (e.g. after the first few pairs) only pays for the scanned part of
+    the list. The first pair yielded is the one returned by target_sum_hash.
+    Proposed time complexity: O(n + number of pairs).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: iterator of two integer tuples with indices of the numbers which sum to target. Smaller index first.
+    """
+    return target_sum_stream_all(lst, target)
+
+def target_sum_count(lst: List[int], target: int) -> int:
+    """
+    Given a list of integers and a target number, count the pairs of indices whose numbers add up to the target,
+    without generating the pairs. Every number forms a pair with every earlier occurrence of its complement, so
+    a dict counting the occurrences of each number seen so far is enough.
+    Proposed time complexity: O(n).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: number of pairs (i, j) with i < j and lst[i] + lst[j] == target
+    """
+    counts = {}
+    pair_count = 0
+    for value in lst:
+        pair_count += counts.get(target - value, 0)
+        counts[value] = counts.get(value, 0) + 1
+    return pair_count
+
+def k_sum(lst: List[int], target: int, k: int) -> Tuple[int, ...]:
+    """
+    Given a list of integers, a target number and a count k, find whether there are k numbers at different indices in the list
+    which add up to the target number and return their indices. Works on a sorted copy of the list: for k = 2 two
+    pointers move towards each other from both ends, and for greater k every number is fixed in turn and the
+    remaining k - 1 numbers are searched to the right of it. Numbers are skipped when even the k smallest (or the
+    largest) candidates can't reach the target, and repeated numbers are only tried once.
+    Proposed time complexity: O(n^(k-1)) for k >= 2, plus O(nlog(n)) for sorting.
+
+    :param lst: list of integers
+    :param target: target number to which k numbers in the list should add up to
+    :param k: number of numbers which should add up to target, at least 1
+    :return: k integer tuple with indices of the numbers which sum to target, in ascending order, or None
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    if len(lst) < k:
+        return None
+    # sorted copy, with the original index of every number - O(nlog(n))
+    order = sorted(range(len(lst)), key=lst.__getitem__)
+    values = [lst[index] for index in order]
+    positions = _k_sum_sorted(values, 0, target, k)
+    if positions is None:
+        return None
+    return tuple(sorted(order[position] for position in positions))
+
+def _k_sum_sorted(values: List[int], first: int, target: int, k: int) -> List[int]:
+    # positions in values[first:] of k numbers which add up to target, or None
+    last = len(values) - 1
+    if k == 1:
+        position = bisect_left(values, target, first)
+        return [position] if position <= last and values[position] == target else None
+    if k == 2:
+        low, high = first, last
+        while low < high:
+            pair_sum = values[low] + values[high]
+            if pair_sum == target:
+                return [low, high]
+            if pair_sum < target:
+                low += 1
+            else:
+                high -= 1
+        return None
+    largest = sum(values[last - k + 2:])
+    for position in range(first, last - k + 2):
+        value = values[position]
+        if position > first and value == values[position - 1]:
+            continue
+        # the k smallest candidates are too big, and so are all candidates further right
+        if sum(values[position:position + k]) > target:
+            return None
+        # even the k - 1 largest numbers can't reach the target together with this number
+        if value + largest < target:
+            continue
+        positions = _k_sum_sorted(values, position + 1, target - value, k - 1)
+        if positions is not None:
+            return [position] + positions
+    return None
+
+def target_sum_all_slow(lst: List[int], target: int) -> List[Tuple[int, int]]:
+    """
+    Brute force reference for target_sum_all and target_sum_count: check every pair of indices.
+    Proposed time complexity: O(n^2).
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: list of all two integer tuples with indices of numbers which sum to target, in the order of target_sum_all
+    """
+    return [(i, j) for j in range(len(lst)) for i in range(j) if lst[i] + lst[j] == target]
+
+def k_sum_slow(lst: List[int], target: int, k: int) -> Tuple[int, ...]:
+    """
+    Brute force reference for k_sum: check every combination of k indices.
+    Proposed time complexity: O(n^k).
+
+    :param lst: list of integers
+    :param target: target number to which k numbers in the list should add up to
+    :param k: number of numbers which should add up to target
+    :return: k integer tuple with indices of the numbers which sum to target, in ascending order, or None
+    """
+    for indices in combinations(range(len(lst)), k):
+        if sum(lst[index] for index in indices) == target:
+            return indices
+
+def read_ints(stream: IO, chunk_size: int = 1 << 16) -> Iterator[int]:
+    """
+    Lazily parse whitespace separated integers from a text or binary stream (file, or socket.makefile()), reading it
+    in chunks, so the numbers can be fed to target_sum_stream without reading the whole input first.
+
+    :param stream: object with a read(size) method returning str or bytes, and an empty result at the end
+    :param chunk_size: number of characters or bytes read at once
+    :return: iterator of the parsed integers
+    """
+    remainder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if remainder:
+            chunk = remainder + chunk
+        tokens = chunk.split()
+        # a chunk which does not end with whitespace may end in the middle of a number,
+        # so the last token is kept until the next chunk is read.
+        remainder = chunk[:0] if chunk[-1:].isspace() else tokens.pop()
+        yield from map(int, tokens)
+    if remainder:
+        yield int(remainder)
+
+def target_sum_sorted(lst: List[int], target: int) -> Tuple[int]:
+    """
+    Given a list of integers sorted in ascending order and a target number, find whether there are two numbers in the list
+    which add up to the given target number and return their indices. Returns the same pair as target_sum_hash.
+    In a sorted list the second number of a pair is at least half of the target, so the scan starts there, and the
+    complement of every number is found with binary search among the numbers before it.
+    Gives wrong results if the list is not sorted.
+    Proposed time complexity: O((n - k)log(n)), where k is the count of numbers smaller than half of the target.
+
+    :param lst: list of integers sorted in ascending order
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    # first number which is at least half of the target, i.e. 2 * number >= target
+    for index in range(bisect_left(lst, -(-target // 2)), len(lst)):
+        # int() keeps the items of numpy arrays from overflowing their integer type
+        complement = target - int(lst[index])
+        # bisect_left finds the first occurrence of the complement
+        complement_index = bisect_left(lst, complement, 0, index)
+        if complement_index < index and lst[complement_index] == complement:
+            return complement_index, index
+
+# widest range of numbers, relative to the length of the list, for which target_sum_bitset builds bitsets
+BITSET_MAX_WIDTH_FACTOR = 64
+
+def target_sum_bitset(lst: List[int], target: int) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices. Returns the same pair as target_sum_hash.
+    Meant for numbers from a bounded range: the numbers in the list are stored as a bitset (a python int with bit
+    v - min set for every number v), and a second bitset holds the same bits in reverse order. Shifted so that the
+    bit of v in the first bitset lines up with the bit of target - v in the second, their AND has a bit set for
+    every number whose complement is in the list too, checking a whole machine word of candidates per operation.
+    If no bit is set there is no pair, otherwise only the numbers whose bit is set are looked at in a final pass
+    over the list, which finds the first completed pair like target_sum_hash. Lists whose numbers span more than
+    BITSET_MAX_WIDTH_FACTOR times their length are passed on to target_sum_hash.
+    Proposed time complexity: O(n + (max - min) / 64) for the bitsets, plus O(n) for the final pass if there is a pair.
+
+    :param lst: list of integers
+    :param target: target number to which two numbers in the list should add up to
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    if len(lst) < 2:
+        return None
+    low, high = min(lst), max(lst)
+    # the sum of two numbers is between twice the smallest and twice the greatest number
+    if not 2 * low <= target <= 2 * high:
+        return None
+    width = high - low + 1
+    if width > BITSET_MAX_WIDTH_FACTOR * len(lst):
+        return target_sum_hash(lst, target)
+    # one ascii digit per number from low to high, the digit of high first - O(n + width)
+    digits = bytearray(b"0") * width
+    deque(map(digits.__setitem__, map(high.__sub__, lst), repeat(ord("1"))), maxlen=0)
+    # parsing the digits as a binary number gives bit v - low for number v, the reversed digits bit high - v - O(width)
+    bits = int(digits, 2)
+    reversed_bits = int(digits[::-1], 2)
+    # bit k of the shifted reversed bitset is the bit of number target - (low + k), as high - (target - low - k) = k + shift
+    shift = high + low - target
+    shifted = reversed_bits >> shift if shift >= 0 else reversed_bits << -shift
+    candidates = bits & shifted
+    if not candidates:
+        return None
+    # the candidate digits, indexed like digits: the digit of number v is at high - v - O(width)
+    candidate_digits = format(candidates, f"0{width}b").encode()
+    is_candidate = map(candidate_digits.__getitem__, map(high.__sub__, lst))
+    seen = {}
+    # single pass like target_sum_hash, where the loop body only runs for candidates - O(n)
+    for index in compress(count(), map(operator.eq, is_candidate, repeat(ord("1")))):
+        value = lst[index]
+        complement_index = seen.get(target - value)
+        if complement_index is not None:
+            return complement_index, index
+        if value not in seen:
+            seen[value] = index
+
+TARGET_SUM_STRATEGIES = {
+    "sorted": target_sum_sorted,
+    "hash": target_sum_hash,
+    "numpy": target_sum_numpy,
+    "bitset": target_sum_bitset,
+    "fast": target_sum_fast,
+    "slow": target_sum_slow,
+    "parallel": target_sum_parallel,
+}
+
+def choose_target_sum_strategy(stats: Dict[str, Any], target: int) -> str:
+    """
+    Choose the fastest target_sum strategy for an input with the given statistics and target. Measured on random inputs:
+    - the sum of two numbers is between twice the smallest and twice the greatest number. If those are known exactly
+      and the target is outside, there is no pair and no strategy is needed (None).
+    - a sorted list is searched with binary search, skipping the numbers smaller than half of the target ('sorted').
+    - numpy arrays and buffers (like binary_io.load_ints) are slow to iterate from Python, so they are processed
+      by numpy, which reads buffers without copying ('numpy').
+    - numpy holds 64 bit integers, so it is only chosen if the (estimated) smallest and greatest number fit into 64
+      bits. Should a number outside of the sample not fit, target_sum_numpy falls back to the hash. The target may be
+      any integer.
+    - if the target is outside of twice the estimated range of numbers, a pair is unlikely, so the whole list would
+      be scanned anyway. target_sum_bitset finds the exact range in two passes in C and rules the pair out without an
+      interpreter loop, or else builds its bitsets if the range is narrow, and falls back to the hash otherwise
+      ('bitset'). At 100000 and 1000000 numbers it took a quarter of the time of numpy, which sorts the whole list.
+    - otherwise the single pass hash ('hash') usually finds a pair early and stops.
+
+    :param stats: statistics returned by inputs.input_stats
+    :param target: target number
+    :return: key of TARGET_SUM_STRATEGIES, or None if the statistics rule out a pair
+    """
+    if stats["length"] < 2:
+        return "hash"
+    if stats["exact"] and not 2 * stats["min"] <= target <= 2 * stats["max"]:
+        return None
+    if stats["is_sorted"]:
+        return "sorted"
+    if stats["is_array"] and backends.has_numpy() and fits_int64(stats["min"], stats["max"]):
+        return "numpy"
+    if not 2 * stats["min"] <= target <= 2 * stats["max"]:
+        return "bitset"
+    return "hash"
+
+def target_sum(lst: Union[List[int], "np.ndarray"], target: int, strategy: str = None,
+               debug: Callable[[str, Dict[str, Any]], None] = None) -> Tuple[int]:
+    """
+    Given a list of integers and a target number, find whether there are two numbers in the list which
+    add up to the given target number and return their indices.
+    Single entry point which takes cheap statistics of the input (see inputs.input_stats) and dispatches to the
+    implementation which is fastest for it (see choose_target_sum_strategy). All implementations chosen automatically
+    return the same pair as target_sum_hash, for integers of any size.
+
+    :param lst: list, numpy array or buffer of integers (such as the memoryview returned by binary_io.load_ints)
+    :param target: target number to which two numbers in the list should add up to
+    :param strategy: key of TARGET_SUM_STRATEGIES to use instead of choosing one. 'sorted' requires a sorted list.
+    :param debug: called with the chosen strategy (None if the statistics rule out a pair) and the input statistics
+        before dispatching
+    :return: Two integer tuple with indices of the numbers which sum to target. Smaller index first.
+    """
+    if strategy is None:
+        stats = input_stats(lst)
+        strategy = choose_target_sum_strategy(stats, target)
+    elif strategy not in TARGET_SUM_STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {sorted(TARGET_SUM_STRATEGIES)}")
+    else:
+        stats = None
+    if debug is not None:
+        debug(strategy, stats if stats is not None else input_stats(lst))
+    if strategy is None:
+        return None
+    if strategy not in ("numpy", "sorted") and backends.is_ndarray(lst):
+        # the other functions compute with the items, which would overflow the integer type of the array
+        lst = lst.tolist()
+    return TARGET_SUM_STRATEGIES[strategy](lst, target)
+
+def single_io_test(func: Callable[[List[int], int], Tuple], test_lst: List[int], 
+                    target: int, expected_result: Tuple[int]) -> bool:
+    """
+    Function to test the correctness of target_sum_slow and target_sum_fast (or functions with same signature and different implementation). 
+    Tests a few trial inputs against expected output. Takes a function as argument and return True if results is correct, False otherwise.
+
+    :param func: target_sum_slow or target_sum_fast or equivalent function with different implementation
+    :return: True if correct, False otherwise
+    """
+    result_dict = func(test_lst, target)
+    if result_dict == expected_result:
+        return True
+    else:
+        print(f"Function {func.__name__} is incorrect.")
+        print(f"Tested input: {test_lst}")
+        print(f"Expected output: {expected_result}")
+        print(f"Actual output: {result_dict}")
+        return False
+
+def multiple_io_tests(func: Callable[[List[int], int], Tuple], duplicates_and_negatives: bool = True) -> Tuple[int]:
+    """
+    Helper functions to run multiple io tests. Takes as argument the lst_to_dict function to be tested and returns a tuple
+    whose first element is the number of passed tests and second element the number of failed tests.
+
+    :param func: lst_to_dict_slow or lst_to_dict_fast (or function with same signature and different implementation)
+    :param duplicates_and_negatives: also test lists with duplicates and negative numbers, which target_sum_fast
+        does not support
+    :return: Tuple with count of succesful and failed tests.
+    """
+    success_count = 0
+    fail_count = 0
+
+    test_lst_1 = [1, 2, 3, 5, 9, 15]
+    target = 7
+    expected_result_1 = (1, 3)
+    result = single_io_test(func, test_lst_1, target, expected_result_1)
+    if result is True:
+        success_count += 1
+    else:
+        fail_count += 1
+
+    if duplicates_and_negatives:
+        # duplicate values, the pair is made of the same number twice
+        test_lst_2 = [3, 8, 3, 1]
+        target = 6
+        expected_result_2 = (0, 2)
+        result = single_io_test(func, test_lst_2, target, expected_result_2)
+        if result is True:
+            success_count += 1
+        else:
+            fail_count += 1
+
+        # negative number and number greater than the target
+        test_lst_3 = [4, -5, 7, 30]
+        target = 25
+        expected_result_3 = (1, 3)
+        result = single_io_test(func, test_lst_3, target, expected_result_3)
+        if result is True:
+            success_count += 1
+        else:
+            fail_count += 1
+
+    print(f"IO test results for {func.__name__}: {success_count} successful and {fail_count} failed.")
+    return success_count, fail_count
+
+def comparative_tests(func_1: Callable[[List[int], int], Tuple], func_2: Callable[[List[int], int], Tuple], reps: int = 20) -> Tuple[int]:
+    """
+    Test two lst_to_dict functions by calling them with the same (random) input and comparing whether the outputs are equal.
+    Returns a tuple where the first int is the number of equal results and the second int is the number of different results.
+
+    :param func_1: first list_to_dict function for testing
+    :param func_2: second list_to_dict function for testing
+    :param reps: number of tests to be performed, defaults to 10
+    :return: Tuple with counts of equal results and different results
+    """
+    # variables for easy modification 
+    list_len = 50
+    max_num = 100
+    target = random.randrange(list_len // 2)
+
+    equal_count = 0
+    diff_count = 0
+    for _ in range(reps):
+        unique_nums = set()
+        while len(unique_nums) < list_len:
+            rand_number = random.randrange(max_num)
+            unique_nums.add(rand_number)
+        test_lst = list(unique_nums)
+        result_1 = func_1(test_lst, target)
+        result_2 = func_2(test_lst, target)
+        if result_1 == result_2:
+            equal_count += 1
+        else:
+            print(f"Functions obtained different results.")
+            print(f"Input data: list = {test_lst}, target={target}")
+            print(f"Output of {func_1.__name__}: ")
+            print(result_1)
+            print(f"Output of {func_2.__name__}:")
+            print(result_2)
+            diff_count += 1
+    print(f"Random comparative test results: out of {reps} trials, {equal_count} equal results and {diff_count} different results were obtained.")
+    return equal_count, diff_count
+
+def mode_comparative_tests(reps: int = 20, max_k: int = 4) -> Tuple[int]:
+    """
+    Test target_sum_all, target_sum_count and k_sum against the brute force references on random lists, which
+    contain duplicates and negative numbers. All pairs and their count have to be equal; k_sum may return a different
+    combination than k_sum_slow, so it has to find one exactly when k_sum_slow does, and it has to be valid.
+    Returns a tuple where the first int is the number of equal results and the second int is the number of different results.
+
+    :param reps: number of random inputs
+    :param max_k: greatest k tested for k_sum, every k from 1 up to it is tested on every input
+    :return: Tuple with counts of equal results and different results
+    """
+    # variables for easy modification
+    max_len = 20
+    max_num = 10
+
+    equal_count = 0
+    diff_count = 0
+    for _ in range(reps):
+        test_lst = [random.randrange(-max_num, max_num) for _ in range(random.randrange(max_len))]
+        target = random.randrange(-2 * max_num, 2 * max_num)
+        expected_pairs = target_sum_all_slow(test_lst, target)
+        results = [("target_sum_all", list(target_sum_all(test_lst, target)), expected_pairs),
+                   ("target_sum_count", target_sum_count(test_lst, target), len(expected_pairs))]
+        for k in range(1, max_k + 1):
+            k_target = random.randrange(-k * max_num, k * max_num)
+            indices = k_sum(test_lst, k_target, k)
+            expected_indices = k_sum_slow(test_lst, k_target, k)
+            valid = (indices is None) == (expected_indices is None)
+            if valid and indices is not None:
+                valid = (len(indices) == k and list(indices) == sorted(set(indices))
+                         and sum(test_lst[index] for index in indices) == k_target)
+            results.append((f"k_sum(k={k}, target={k_target})", indices, indices if valid else expected_indices))
+        for name, result, expected in results:
+            if result == expected:
+                equal_count += 1
+            else:
+                print(f"Function {name} obtained a different result than the brute force reference.")
+                print(f"Input data: list = {test_lst}, target={target}")
+                print(f"Output of {name}: {result}")
+                print(f"Output of the brute force reference: {expected}")
+                diff_count += 1
+    print(f"Random mode comparative test results: {equal_count} equal results and {diff_count} different results were obtained.")
+    return equal_count, diff_count
+
+def batch_comparative_tests(reps: int = 20, probe_length: int = 2) -> Tuple[int]:
+    """
+    Test every method of target_sum_many against target_sum_hash called once per target, on random lists which contain
+    duplicates and negative numbers. The lists are shorter than NUMPY_MIN_LENGTH and probe_length is small, so 'auto'
+    has to scan past the probe instead of falling back to numpy.
+    Returns a tuple where the first int is the number of equal results and the second int is the number of different results.
+
+    :param reps: number of random inputs
+    :param probe_length: probe_length passed to target_sum_many
+    :return: Tuple with counts of equal results and different results
+    """
+    # variables for easy modification
+    max_len = 30
+    max_num = 20
+    target_count = 10
+
+    methods = ["auto", "hash"] + (["numpy"] if backends.has_numpy() else [])
+    equal_count = 0
+    diff_count = 0
+    for _ in range(reps):
+        test_lst = [random.randrange(-max_num, max_num) for _ in range(random.randrange(max_len))]
+        targets = [random.randrange(-2 * max_num, 2 * max_num) for _ in range(target_count)]
+        expected = [target_sum_hash(test_lst, target) for target in targets]
+        for method in methods:
+            result = target_sum_many(test_lst, targets, method, probe_length)
+            if result == expected:
+                equal_count += 1
+            else:
+                print(f"Function target_sum_many({method}) obtained a different result than target_sum_hash.")
+                print(f"Input data: list = {test_lst}, targets={targets}")
+                print(f"Output of target_sum_many({method}): {result}")
+                print(f"Output of target_sum_hash: {expected}")
+                diff_count += 1
+    print(f"Random batch comparative test results: {equal_count} equal results and {diff_count} different results were obtained.")
+    return equal_count, diff_count
+
+def random_test_list(input_len: int) -> List[int]:
+    """
+    Generate the input list used by single_speed_trial and single_memory_trial: random distinct integers in the range
+    [0, 2 * input_len), in random order.
+
+    :param input_len: desired length of input list, one more number is generated.
+    :return: list of random distinct integers
+    """
+    unique_nums = set()
+    while len(unique_nums) <= input_len:
+        rand_number = random.randrange(input_len * 2)
+        unique_nums.add(rand_number)
+    test_lst = list(unique_nums)
+    random.shuffle(test_lst)
+    random.shuffle(test_lst)
+    random.shuffle(test_lst)
+    return test_lst
+
+def single_memory_trial(input_len: int, func: Callable[[List[int], int], Tuple], target: int = None) -> Tuple[int, int]:
+    """
+    Function to test memory use of target_sum functions, with the same kind of input as single_speed_trial. Measures the peak
+    memory allocated during the call, e.g. by the dict of numbers, and the size of the returned object.
+
+    :param input_len: desired length of input list for testing.
+    :param func: target_sum function to be tested.
+    :param target: target number, defaults to a random number smaller than half of the input length
+    :return: peak allocation and result size in bytes
+    """
+    if target is None:
+        target = random.randrange(input_len // 2)
+    test_lst = random_test_list(input_len)
+    _, peak, result_size = measure_memory(func, test_lst, target)
+    print(f"For function {func.__name__}, peak allocation for input length {input_len} was {peak / 1_000_000:.3f}MB "
+          f"and the result takes {result_size} bytes")
+    return peak, result_size
+
+def single_speed_trial(input_len: int, func: Callable[[List[int], int, int], Dict], target: int = None) -> float:
+    """
+    Function to test speed of lst_to_dict functions. Generates a list of random distinct integers of the desired input length in the 
+    desired range and measures time taken in milliseconds. If trial_count is changed to an int greater than 1, multiple trials are 
+    performed and the average time is returned. For repeated measurements with warmup and statistics, use benchmark.py.
+    For instrumented functions (see instrument.py), the time taken by each phase is printed too.
+
+    :param input_len: desired length of input list for testing.
+    :param func: lst_to_dict function to be tested.
+    :param target: target number, defaults to a random number smaller than half of the input length
+    :return: time in milliseconds
+    """
+    if target is None:
+        target = random.randrange(input_len // 2)
+    test_lst = random_test_list(input_len)
+    with instrument.capture() as records:
+        start_time = time.perf_counter_ns() / 1_000_000
+        result = func(test_lst, target)
+        end_time = time.perf_counter_ns() / 1_000_000
+    elapsed_time = end_time - start_time
+    found = False
+    if result:
+        found = True
+    print(f"For function {func.__name__}, time taken for input length {input_len} was {elapsed_time:.3f}ms")
+    for record in records:
+        print(instrument.format_record(record))
+    if found:
+        first_index = result[0]
+        second_index = result[1]
+        first_num = test_lst[first_index]
+        second_num = test_lst[second_index]
+        print(f"The function found numbers adding up to target of {target}: {first_num} + {second_num} at indices {first_index} and {second_index}.")
+    else:
+        print("No numbers adding up to target were found")
+    return elapsed_time
+
+def multiple_speed_trials(input_len: int, func: Callable[[List[int], int, int], Dict], trial_count: int, target: int = None,
+                          memory: bool = False) -> float:
+    """
+    Helper function which runs multiple speed trials and returns the average time.
+
+    :param input_len: desired length of input list for testing.
+    :param func: lst_to_dict function to be tested.
+    :param trial_count: number of times the experiment is repeated.
+    :param target: target number used in every trial, defaults to a new random target for each trial
+    :param memory: also run a memory trial after every speed trial, and print the average peak allocation and result size
+    :return: average time in milliseconds
+    """
+    time_results = []
+    memory_results = []
+    for _ in range(trial_count):
+        result = single_speed_trial(input_len, func, target)
+        time_results.append(result)
+        if memory:
+            memory_results.append(single_memory_trial(input_len, func, target))
+    average_time = sum(time_results) / len(time_results)
+    print(f"For function {func.__name__}, average time taken for input length {input_len} over {trial_count} trials was {average_time:.3f}ms")
+    if memory:
+        average_peak = sum(peak for peak, _ in memory_results) / len(memory_results)
+        average_size = sum(size for _, size in memory_results) / len(memory_results)
+        print(f"For function {func.__name__}, average peak allocation for input length {input_len} over {trial_count} trials was "
+              f"{average_peak / 1_000_000:.3f}MB and the result takes {average_size:.0f} bytes")
+    return average_time
+
+def target_size_speed_trials(input_len: int, func: Callable[[List[int], int], Tuple], trial_count: int,
+                             targets: List[int] = None) -> Dict[int, float]:
+    """
+    Helper function which runs multiple speed trials for each of the given targets, while the length of the
+    input list stays fixed. Useful for checking whether the time taken depends on the size of the target.
+
+    :param input_len: desired length of input list for testing.
+    :param func: target_sum function to be tested.
+    :param trial_count: number of times the experiment is repeated for each target.
+    :param targets: targets to sweep, defaults to targets growing by a factor of 10 up to 10_000 times the input length.
+    :return: dict with targets as keys and average time in milliseconds as values
+    """
+    if targets is None:
+        targets = [input_len * 10 ** exponent for exponent in range(5)]
+    results = {}
+    for target in targets:
+        results[target] = multiple_speed_trials(input_len, func, trial_count, target)
+    return results
+
+def parallel_scaling_trials(input_len: int, worker_counts: List[int] = None, target: int = None) -> Dict[int, float]:
+    """
+    Function to measure how target_sum_parallel scales with the number of worker processes. Generates a list of random distinct
+    integers like single_speed_trial, and measures time taken in milliseconds for each worker count, next to target_sum_hash
+    on a single core (see parallel.scaling_trials).
+
+    :param input_len: desired length of input list for testing.
+    :param worker_counts: numbers of worker processes to try, defaults to powers of two up to the number of CPUs.
+    :param target: target number, defaults to one which no pair adds up to, so the whole list has to be processed
+    :return: dict with worker counts as keys and time in milliseconds as values
+    """
+    if target is None:
+        target = -1
+    test_lst = random_test_list(input_len)
+    return parallel.scaling_trials(target_sum_hash, target_sum_parallel, test_lst, (target,), worker_counts)
+
+def batch_speed_trials(input_len: int, target_counts: List[int] = None) -> Dict[int, Dict[str, float]]:
+    """
+    Function to compare answering many targets against the same list with target_sum_many, against calling target_sum_hash
+    for every target. Generates a list of random distinct integers like single_speed_trial, and random targets up to twice
+    the greatest number, so that a part of the targets has no pair. Prints the time taken per target in microseconds.
+
+    :param input_len: desired length of input list for testing.
+    :param target_counts: numbers of targets to try, defaults to 1, 100 and 10_000
+    :return: dict with target counts as keys and dicts of method name to microseconds per target as values
+    """
+    if target_counts is None:
+        target_counts = [1, 100, 10_000]
+    test_lst = random_test_list(input_len)
+    methods = ["hash"] + (["numpy", "auto"] if backends.has_numpy() else [])
+
+    results = {}
+    for target_count in target_counts:
+        targets = [random.randrange(input_len * 4) for _ in range(target_count)]
+        results[target_count] = {}
+        start_time = time.perf_counter_ns()
+        for target in targets:
+            _ = target_sum_hash(test_lst, target)
+        results[target_count][target_sum_hash.__name__] = (time.perf_counter_ns() - start_time) / 1000 / target_count
+        for method in methods:
+            start_time = time.perf_counter_ns()
+            _ = target_sum_many(test_lst, targets, method)
+            results[target_count][f"{target_sum_many.__name__}({method})"] = (time.perf_counter_ns() - start_time) / 1000 / target_count
+        for name, per_target in results[target_count].items():
+            print(f"For {name}, time taken per target for {target_count} targets and input length {input_len} was {per_target:.1f}us")
+    return results
+
+def run_tests(io_correctness: bool = True, comparative_correctness: bool = True, speed: bool = True, input_length: int = 10_000,
+              memory: bool = False, trials: int = 20) -> None:
+    def target_sum_stream_first(lst: List[int], target: int) -> Tuple[int]:
+        return next(target_sum_stream(iter(lst), target), None)
+
+    if io_correctness:
+        _ = multiple_io_tests(target_sum_slow)
+        _ = multiple_io_tests(target_sum_fast, duplicates_and_negatives=False)
+        _ = multiple_io_tests(target_sum_hash)
+        _ = multiple_io_tests(target_sum_bitset)
+        _ = multiple_io_tests(target_sum_stream_first)
+        _ = multiple_io_tests(target_sum)
+        if backends.has_numpy():
+            _ = multiple_io_tests(target_sum_numpy)
+    if comparative_correctness:
+        _ = comparative_tests(target_sum_slow, target_sum_fast)
+        _ = comparative_tests(target_sum_hash, target_sum_bitset)
+        _ = mode_comparative_tests()
+        _ = batch_comparative_tests()
+    if speed:
+        _ = multiple_speed_trials(input_length, target_sum_slow, trials, memory=memory)
+        _ = multiple_speed_trials(input_length, target_sum_fast, trials, memory=memory)
+        _ = multiple_speed_trials(input_length, target_sum_hash, trials, memory=memory)
+        _ = multiple_speed_trials(input_length, target_sum_bitset, trials, memory=memory)
+        _ = multiple_speed_trials(input_length, target_sum, trials, memory=memory)
+        if backends.has_numpy():
+            _ = multiple_speed_trials(input_length, target_sum_numpy, trials, memory=memory)
+        _ = target_size_speed_trials(input_length, target_sum_fast, 5)
+        _ = target_size_speed_trials(input_length, target_sum_hash, 5)
+        _ = target_size_speed_trials(input_length, target_sum_bitset, 5)
+        _ = parallel_scaling_trials(input_length)
+        _ = batch_speed_trials(input_length)
+